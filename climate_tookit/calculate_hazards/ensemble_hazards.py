@@ -30,7 +30,7 @@ from hazards import (
     evaluate_threshold,
     calculate_season_statistics,
     calculate_hazards,
-    add_et0,
+    et0_hargreaves,
     water_balance_hazards,
     heat_stress_hazards,
     dry_days_hazard,
@@ -43,6 +43,7 @@ sys.path.insert(0, os.path.join(PARENT, 'fetch_data', 'preprocess_data'))
 sys.path.insert(0, os.path.join(PARENT, 'fetch_data', 'source_data', 'sources'))
 from preprocess_data import preprocess_data
 from utils.models      import ClimateVariable
+from sources.utils.settings import set_logging
 
 # Optional: only used by auto-detect
 try:
@@ -119,9 +120,10 @@ def _prepare(df: pd.DataFrame, lat: float) -> pd.DataFrame:
         df = df.rename(columns=rename)
     # Attach Hargreaves ET0 so calculate_season_statistics can derive NDWS / NDWL0.
     if {'min_temperature', 'max_temperature', 'date'}.issubset(df.columns):
-        view = df.rename(columns={'min_temperature': 'tmin',
-                                  'max_temperature': 'tmax'})
-        df['ET0_mm_day'] = add_et0(view, lat)['ET0_mm_day'].values
+        df['ET0_mm_day'] = et0_hargreaves(
+            df['min_temperature'], df['max_temperature'],
+            pd.to_datetime(df['date']).dt.dayofyear.to_numpy(), lat,
+        )
     return df
 
 def _fetch(lat: float, lon: float, start: str, end: str,
@@ -859,6 +861,7 @@ if __name__ == "__main__":
     p.add_argument('--output',       type=str, default=None,
                    help='write full result as JSON to this path')
     args = p.parse_args()
+    set_logging()
 
     if args.list_models:
         print("Models:");    [print(f"  {m}") for m in MODELS]
@@ -14,6 +14,7 @@ import sys
 import os
 from datetime import date, datetime
 from typing import Dict, List, Any, Tuple, Optional
+import numpy as np
 import pandas as pd
 import json
 import argparse
@@ -25,6 +26,10 @@ project_root = os.path.dirname(parent_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+# Optional: numba compiles the sequential water-balance loop; without it the
+# same function runs as plain Python.
+from climate_tookit.season_analysis.numba_compat import njit
+
 SEASON_ANALYSIS_AVAILABLE = False
 _IMPORT_ERROR: str = ""
 
@@ -32,11 +37,13 @@ try:
     from climate_tookit.season_analysis.seasons import (
         get_climate_data,
         add_et0,
+        et0_hargreaves,
         detect_onset_cessation,
         fetch_and_analyze_years,
         fetch_and_analyze_years_fixed,
         parse_fixed_seasons,
     )
+    from sources.utils.settings import set_logging
     SEASON_ANALYSIS_AVAILABLE = True
 except Exception as _e:
     _IMPORT_ERROR = str(_e)
@@ -75,6 +82,7 @@ CROP_THRESHOLDS = {
 }
 
 # Climate data helpers
+SEASON_FETCH_WORKERS = 8  # concurrent per-season window fetches
 def get_climate_data_for_season(
     lat: float, lon: float, start_date: str, end_date: str
 ) -> pd.DataFrame:
@@ -90,6 +98,21 @@ def get_climate_data_for_season(
     df = add_et0(df, lat) 
     return df
 
+def _attach_season_frames(lat: float, lon: float, entries: List[Dict[str, Any]]) -> None:
+    """Fetch each entry's season window concurrently and store it as entry['df'].
+
+    Windows are fetched one by one rather than sliced from a single span:
+    preprocess_data fills gaps, clips outliers and picks unit conversions
+    from the statistics of the window it is given.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max(1, min(SEASON_FETCH_WORKERS, len(entries)))) as ex:
+        frames = list(ex.map(
+            lambda e: get_climate_data_for_season(lat, lon, *e['window']), entries
+        ))
+    for entry, df in zip(entries, frames):
+        entry['df'] = df
+
 # Dry-spell detection
 def detect_dry_spells(
     df: pd.DataFrame,
@@ -103,35 +126,25 @@ def detect_dry_spells(
     if not precip_col or 'date' not in df.columns:
         return []
 
-    df = df.sort_values('date').copy()
-    df['is_dry'] = df[precip_col] < precip_threshold
-
-    dry_spells: List[Dict[str, Any]] = []
-    spell_start = None
-    spell_days  = 0
-
-    for idx, row in df.iterrows():
-        if row['is_dry']:
-            spell_start = spell_start or row['date']
-            spell_days += 1
-        else:
-            if spell_start and spell_days >= min_dry_days:
-                prev_loc = df.index.get_loc(idx) - 1
-                dry_spells.append({
-                    'start_date':  spell_start,
-                    'end_date':    df.iloc[prev_loc]['date'],
-                    'length_days': spell_days,
-                })
-            spell_start = None
-            spell_days  = 0
-            
-    if spell_start and spell_days >= min_dry_days:
-        dry_spells.append({
-            'start_date':  spell_start,
-            'end_date':    df.iloc[-1]['date'],
-            'length_days': spell_days,
-        })
-    return dry_spells
+    # Work on sorted NumPy arrays; the caller's frame is never modified.
+    order  = np.argsort(df['date'].to_numpy(), kind='stable')
+    dates  = df['date'].iloc[order]
+    is_dry = df[precip_col].to_numpy(dtype=float)[order] < precip_threshold
+
+    # Run-length encode the dry days: edges of each run of consecutive dry rows.
+    padded = np.concatenate(([False], is_dry, [False]))
+    edges  = np.flatnonzero(padded[1:] != padded[:-1])
+    starts, ends = edges[::2], edges[1::2]
+    keep   = (ends - starts) >= min_dry_days
+
+    return [
+        {
+            'start_date':  dates.iloc[s],
+            'end_date':    dates.iloc[e - 1],
+            'length_days': int(e - s),
+        }
+        for s, e in zip(starts[keep], ends[keep])
+    ]
 
 def calculate_dry_spell_statistics(dry_spells: List[Dict[str, Any]]) -> Dict[str, Any]:
     if not dry_spells:
@@ -141,15 +154,20 @@ def calculate_dry_spell_statistics(dry_spells: List[Dict[str, Any]]) -> Dict[str
             'mean_dry_spell_length_days': 0.0,
             'dry_spells':                 [],
         }
-    lengths = [s['length_days'] for s in dry_spells]
+    # Count, max, total and the 10-day histogram in a single pass.
     dist: Dict[str, int] = {}
-    for ln in lengths:
+    longest = total = 0
+    for s in dry_spells:
+        ln = s['length_days']
+        total += ln
+        if ln > longest:
+            longest = ln
         key = f"{(ln // 10) * 10}-{(ln // 10) * 10 + 9}"
         dist[key] = dist.get(key, 0) + 1
     return {
         'number_of_dry_spells':       len(dry_spells),
-        'max_dry_spell_length_days':  max(lengths),
-        'mean_dry_spell_length_days': round(sum(lengths) / len(lengths), 2),
+        'max_dry_spell_length_days':  longest,
+        'mean_dry_spell_length_days': round(total / len(dry_spells), 2),
         'length_distribution':        dist,
         'dry_spells':                 dry_spells,
     }
@@ -181,32 +199,42 @@ def calc_water_balance(
         out['RUNOFF']  = pd.NA
         return out
 
-    rain = out[precip_col].fillna(0).to_numpy()
-    pet  = out['ET0_mm_day'].fillna(0).to_numpy()
+    rain = out[precip_col].fillna(0).to_numpy(dtype=np.float64)
+    pet  = out['ET0_mm_day'].fillna(0).to_numpy(dtype=np.float64)
 
-    eratios, loggings, runoffs = [], [], []
-    avail = float(init_avail)
-    denom = 97.0 - 3.868 * (soilcp ** 0.5)
-    for r, e in zip(rain, pet):
+    eratios, loggings, runoffs = _water_balance_scan(
+        rain, pet, float(soilcp), float(soilsat), float(kc), float(init_avail)
+    )
+    out['ERATIO']  = eratios
+    out['LOGGING'] = loggings
+    out['RUNOFF']  = runoffs
+    return out
+
+@njit(cache=True)
+def _water_balance_scan(rain, pet, soilcp, soilsat, kc, init_avail):
+    """Day-by-day bucket model behind calc_water_balance (numba-compiled when available)."""
+    n        = rain.shape[0]
+    eratios  = np.empty(n)
+    loggings = np.empty(n)
+    runoffs  = np.empty(n)
+    avail    = init_avail
+    denom    = 97.0 - 3.868 * (soilcp ** 0.5)
+    for k in range(n):
         avail = min(avail, soilcp)
         percwt = min(avail / soilcp * 100.0, 100.0) if soilcp > 0 else 1.0
         percwt = max(percwt, 1.0)
         eratio = min(percwt / denom, 1.0) if denom > 0 else 1.0
-        demand = eratio * kc * float(e)
+        demand = eratio * kc * pet[k]
 
-        result  = avail + float(r) - demand
+        result  = avail + rain[k] - demand
         logging = min(max(result - soilcp, 0.0), soilsat)
         runoff  = max(result - logging - soilcp, 0.0)
         avail   = max(min(soilcp, result), 0.0)
 
-        eratios.append(eratio)
-        loggings.append(logging)
-        runoffs.append(runoff)
-
-    out['ERATIO']  = eratios
-    out['LOGGING'] = loggings
-    out['RUNOFF']  = runoffs
-    return out
+        eratios[k]  = eratio
+        loggings[k] = logging
+        runoffs[k]  = runoff
+    return eratios, loggings, runoffs
 
 # Season statistics
 def calculate_season_statistics(
@@ -222,14 +250,17 @@ def calculate_season_statistics(
     )
     p = None
     if precip_col:
-        p = df[precip_col].copy()
+        # Read-only below, so no copy; the dry-day count is taken once and
+        # shared by dry_days and NDD.
+        p = df[precip_col]
+        n_dry = int((p < 1.0).sum())
         stats['total_precipitation_mm']      = float(p.sum())
         stats['mean_daily_precipitation_mm'] = float(p.mean())
         stats['max_daily_precipitation_mm']  = float(p.max())
         stats['rainy_days']                  = int((p >= 1.0).sum())
-        stats['dry_days']                    = int((p < 1.0).sum())
+        stats['dry_days']                    = n_dry
         # NDD: Number of Dry Days (precip < 1 mm) -- canonical hazard label
-        stats['NDD']                         = int((p < 1.0).sum())
+        stats['NDD']                         = n_dry
         stats['dry_spell_statistics']        = calculate_dry_spell_statistics(
             detect_dry_spells(df, min_dry_days=7, precip_threshold=1.0)
         )
@@ -242,11 +273,11 @@ def calculate_season_statistics(
         None,
     )
     if tmax_col and tmin_col:
-        tmax = df[tmax_col].copy()
-        tmin = df[tmin_col].copy()
+        tmax = df[tmax_col]
+        tmin = df[tmin_col]
         if tmax.mean() > 100:
-            tmax -= 273.15
-            tmin -= 273.15
+            tmax = tmax - 273.15
+            tmin = tmin - 273.15
         tavg = (tmax + tmin) / 2
         stats['mean_temperature_c'] = float(tavg.mean())
         stats['mean_tmax_c']        = float(tmax.mean())
@@ -653,10 +684,11 @@ def calculate_hazards(
                     'total_seasons_per_year': num_seasons_per_year,     
                     'source':                 source,                   
                 }
-                df = get_climate_data_for_season(lat, lon, s_start, s_end)
-                all_results.append({'season_info': season_info, 'df': df})
+                all_results.append({'season_info': season_info,
+                                    'window':      (s_start, s_end)})
         if not all_results:
             return {'error': 'No seasons produced by fixed-season mode for the given date range.'}
+        _attach_season_frames(lat, lon, all_results)
 
     # auto-detect via fetch_and_analyze_years, always use chirps+chirts for auto-detection
     elif SEASON_ANALYSIS_AVAILABLE:
@@ -695,8 +727,9 @@ def calculate_hazards(
                     'total_seasons_per_year': num_seasons_per_year,
                     'source':                 auto_source,
                 }
-                df = get_climate_data_for_season(lat, lon, s_start, s_end)
-                all_results.append({'season_info': season_info, 'df': df})
+                all_results.append({'season_info': season_info,
+                                    'window':      (s_start, s_end)})
+        _attach_season_frames(lat, lon, all_results)
     else:
         return {
             'error': (
@@ -1100,6 +1133,8 @@ if __name__ == "__main__":
     parser.add_argument('--output',          type=str, default=None,
                         help='Save JSON result to this file path')
     args = parser.parse_args()
+    if SEASON_ANALYSIS_AVAILABLE:
+        set_logging()
 
     # Validate explicit-season pair
     if bool(args.season_start) != bool(args.season_end):
@@ -1131,17 +1166,25 @@ if __name__ == "__main__":
         soilcp=soilcp,
         soilsat=soilsat,
     )
+    # Indent only for a human at a terminal; piped output and --output files
+    # get compact JSON, which is several times smaller and faster to write
+    # for multi-year runs.
+    compact = {'separators': (',', ':'), 'default': str}
     if args.format == 'json':
-        output_str = json.dumps(result, indent=2, default=str)
-        print(output_str)
+        if sys.stdout.isatty():
+            print(json.dumps(result, indent=2, default=str))
+            output_str = None
+        else:
+            output_str = json.dumps(result, **compact)
+            print(output_str)
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(output_str)
+                f.write(output_str or json.dumps(result, **compact))
     else:
         print_hazard_results(result)
         if args.output:
             with open(args.output, 'w') as f:
-                f.write(json.dumps(result, indent=2, default=str))
+                json.dump(result, f, **compact)
 
 # Auto-detect season (no season flag supplied -- always uses chirps+chirts internally):
 # python -m climate_tookit.calculate_hazards.hazards maize --location="-1.286,36.817" --date-from 2016-01-01 --date-to 2016-12-31
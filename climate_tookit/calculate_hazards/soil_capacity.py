@@ -247,13 +247,8 @@ def _fill_texture_remainder(std: Dict[str, float]) -> None:
     if "clay" not in std and "sand" in std and "silt" in std:
         std["clay"] = max(0.0, 100.0 - std["sand"] - std["silt"])
 
-def _download_soil_properties(lat: float, lon: float) -> List[Dict[str, float]]:
-    """
-    Fetch soil properties for the point via the toolkit's ``soil_grid`` source and return one layer dict per root-zone horizon, in the standard units that
-    ``compute_soil_capacity`` expects. Returns ``[]`` if the source yields no data (caller then falls back to defaults).
-    The ISRIC SoilGrids download, unit conversion, and depth handling all live in ``sources/soil_grid.py``; here we only translate the returned soil-variable
-    columns into PTF property keys and fill any missing texture fraction.
-    """
+def _add_source_paths() -> None:
+    """Put the toolkit's ``source_data`` package directories on ``sys.path``."""
     import os
     import sys
 
@@ -264,6 +259,15 @@ def _download_soil_properties(lat: float, lon: float) -> List[Dict[str, float]]:
         if p not in sys.path:
             sys.path.insert(0, p)
 
+
+def _download_soil_properties(lat: float, lon: float) -> List[Dict[str, float]]:
+    """
+    Fetch soil properties for the point via the toolkit's ``soil_grid`` source and return one layer dict per root-zone horizon, in the standard units that
+    ``compute_soil_capacity`` expects. Returns ``[]`` if the source yields no data (caller then falls back to defaults).
+    The ISRIC SoilGrids download, unit conversion, and depth handling all live in ``sources/soil_grid.py``; here we only translate the returned soil-variable
+    columns into PTF property keys and fill any missing texture fraction.
+    """
+    _add_source_paths()
     from sources.utils.models import ClimateDataset, SoilVariable
     from sources.utils.settings import Settings
     from source_data import SourceData
@@ -289,28 +293,36 @@ def _download_soil_properties(lat: float, lon: float) -> List[Dict[str, float]]:
     if df is None or df.empty:
         return []
 
+    # Resolve column positions once and walk plain row tuples.
+    cols      = list(df.columns)
+    ptf_pos   = [(cols.index(col), ptf_key)
+                 for col, ptf_key in _SOILVAR_TO_PTF.items() if col in cols]
+    depth_pos = [(cols.index(key), key) for key in ("top_cm", "bottom_cm") if key in cols]
+
     layers: List[Dict[str, float]] = []
-    for _, row in df.iterrows():
+    for row in df.itertuples(index=False, name=None):
         props: Dict[str, float] = {}
-        for col, ptf_key in _SOILVAR_TO_PTF.items():
-            if col in df.columns:
-                val = row[col]
-                # skip None / NaN (NaN != NaN)
-                if val is not None and val == val:
-                    props[ptf_key] = float(val)
+        for pos, ptf_key in ptf_pos:
+            val = row[pos]
+            # skip None / NaN (NaN != NaN)
+            if val is not None and val == val:
+                props[ptf_key] = float(val)
         _fill_texture_remainder(props)
         if not props:
             continue
         layer = dict(_PROP_DEFAULTS)
         layer.update(props)
-        if "top_cm" in df.columns and row["top_cm"] == row["top_cm"]:
-            layer["top_cm"] = float(row["top_cm"])
-        if "bottom_cm" in df.columns and row["bottom_cm"] == row["bottom_cm"]:
-            layer["bottom_cm"] = float(row["bottom_cm"])
+        for pos, key in depth_pos:
+            if row[pos] == row[pos]:
+                layer[key] = float(row[pos])
         layers.append(layer)
     return layers
 
 if __name__ == "__main__":
+    _add_source_paths()
+    from sources.utils.settings import set_logging
+    set_logging()
+
     # Quick offline sanity check of the pedotransfer math (no GEE needed):
     # a clayey profile should hold more plant-available water than a sandy one.
     sandy = {"sand": 85, "silt": 10, "clay": 5,  "oc": 5,  "bld": 1500, "cec": 5,  "ph_x10": 65}
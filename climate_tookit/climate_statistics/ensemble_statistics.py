@@ -44,6 +44,7 @@ from climate_tookit.climate_statistics.statistics import (
     _is_num,
     _avg,
 )
+from sources.utils.settings import set_logging
 
 import pandas as pd
 
@@ -633,6 +634,7 @@ def main() -> None:
                    help='Parallel GEE fetch workers across models '
                         '(default: auto = one per model, capped at 16; use 1 to disable)')
     args = p.parse_args()
+    set_logging()
 
     try:
         lat, lon = (float(x) for x in
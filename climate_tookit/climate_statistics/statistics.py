@@ -20,10 +20,11 @@ import sys
 import math
 import json
 import argparse
+import calendar
 import warnings
 from datetime import datetime, date
 from pathlib import Path
-from typing import Tuple, Dict, List, Any, Optional
+from typing import Tuple, Dict, List, Any, Optional, Union
 
 import pandas as pd
 import numpy as np
@@ -36,6 +37,7 @@ sys.path.append(os.path.join(_parent_dir, 'fetch_data', 'preprocess_data'))
 sys.path.append(os.path.join(_parent_dir, 'season_analysis'))
 
 from preprocess_data import preprocess_data
+from sources.utils.settings import set_logging
 PREPROCESS_AVAILABLE = True
 
 try:
@@ -115,7 +117,7 @@ def _fetch_chirps_chirts(lat, lon, date_from, date_to):
 
 def get_climate_data(
     lat: float, lon: float,
-    start_date: str, end_date: str,
+    start_date: Union[str, date], end_date: Union[str, date],
     source: str,
     model:    Optional[str] = None,
     scenario: Optional[str] = None,
@@ -132,8 +134,8 @@ def get_climate_data(
     if not PREPROCESS_AVAILABLE:
         raise RuntimeError("preprocess_data pipeline not available")
 
-    date_from = date.fromisoformat(start_date)
-    date_to   = date.fromisoformat(end_date)
+    date_from = start_date if isinstance(start_date, date) else date.fromisoformat(start_date)
+    date_to   = end_date   if isinstance(end_date, date)   else date.fromisoformat(end_date)
     source_lc = source.lower()
 
     # Resolve source -> raw DataFrame
@@ -148,7 +150,8 @@ def get_climate_data(
         raise RuntimeError(f"No data returned from source '{source}'")
 
     df = df.rename(columns=RENAME_MAP).copy()
-    df['date'] = pd.to_datetime(df['date'])
+    if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        df['date'] = pd.to_datetime(df['date'], cache=True)
 
     # Minimum required for ET0 + water balance
     if 'precip' not in df.columns:
@@ -604,10 +607,12 @@ def analyze_climate_statistics(
         if fixed_season:
             fetch_end = f"{end_year + 1}-12-31"
         else:
-            tail_month = min(12, 6 + 0)  # 6 extra months -> June+1 = July
-            tail_end_dt = (date(end_year, 12, 31) +
-                           pd.DateOffset(months=extra_months)).date()
-            fetch_end = tail_end_dt.strftime('%Y-%m-%d')
+            # Last day of the extra_months-th month after end_year, read
+            # from the calendar table (6 -> June 30 of end_year + 1).
+            tail_year  = end_year + 1 + (extra_months - 1) // 12
+            tail_month = (extra_months - 1) % 12 + 1
+            fetch_end  = (f"{tail_year}-{tail_month:02d}-"
+                          f"{calendar.monthrange(tail_year, tail_month)[1]:02d}")
     else:
         fetch_end = f"{end_year}-12-31"
 
@@ -619,6 +624,9 @@ def analyze_climate_statistics(
 
     # ET0 + water balance
     df = add_et0(df, lat)
+    # seasons stores ET0 as float32; the water balance and ET0 totals are
+    # long running sums, so accumulate them in float64 like precip.
+    df['ET0_mm_day'] = df['ET0_mm_day'].astype(np.float64)
     df = calculate_water_balance(df)
 
     # Season detection (uses full df with tail for year-crossing capture)
@@ -957,6 +965,7 @@ def main() -> None:
                         help='Skip saving the JSON output')
 
     args = parser.parse_args()
+    set_logging()
 
     try:
         lat, lon = map(float, args.location.split(','))
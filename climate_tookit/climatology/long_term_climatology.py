@@ -283,23 +283,28 @@ def compute_monthly_climatology(
     if combined_df.empty:
         return monthly
 
-    df = combined_df.copy()
-    df['date'] = pd.to_datetime(df['date'])
-    df['_yr'] = df['date'].dt.year
-    df['_mo'] = df['date'].dt.month
+    # Group by derived year/month key Series instead of copying the frame to
+    # add key columns, and let one named .agg per grouping compute every
+    # statistic rather than re-grouping the data once per statistic.
+    df = combined_df
+    dates = pd.to_datetime(df['date'])
+    yr = dates.dt.year.rename('_yr')
+    mo = dates.dt.month.rename('_mo')
 
     if precip_col and df[precip_col].notna().any():
-        monthly_totals = df.groupby(['_yr', '_mo'])[precip_col].sum()
-        mean_total = monthly_totals.groupby(level='_mo').mean()
-        std_total = monthly_totals.groupby(level='_mo').std()
-        min_total = monthly_totals.groupby(level='_mo').min()
-        max_total = monthly_totals.groupby(level='_mo').max()
-        mean_daily = df.groupby('_mo')[precip_col].mean()
-        rainy_per_month = (
-            df.assign(_rd=(df[precip_col] > 1.0).astype(int))
-              .groupby(['_yr', '_mo'])['_rd'].sum()
-              .groupby(level='_mo').mean()
+        precip = df[precip_col]
+        per_month_year = (
+            pd.DataFrame({'total': precip, 'rainy': precip > 1.0})
+              .groupby([yr, mo])
+              .agg(total=('total', 'sum'), rainy=('rainy', 'sum'))
         )
+        total_stats = per_month_year['total'].groupby(level='_mo').agg(['mean', 'std', 'min', 'max'])
+        mean_total = total_stats['mean']
+        std_total = total_stats['std']
+        min_total = total_stats['min']
+        max_total = total_stats['max']
+        mean_daily = precip.groupby(mo).mean()
+        rainy_per_month = per_month_year['rainy'].groupby(level='_mo').mean()
         monthly['precipitation'] = {
             int(m): {
                 'mean_monthly_total_mm': round(float(mean_total.get(m, float('nan'))), 2),
@@ -312,13 +317,20 @@ def compute_monthly_climatology(
             for m in range(1, 13) if m in mean_total.index
         }
     if tmax_col and tmin_col and df[tmax_col].notna().any() and df[tmin_col].notna().any():
-        df['_tavg'] = (df[tmax_col] + df[tmin_col]) / 2
-        mean_tmax = df.groupby('_mo')[tmax_col].mean()
-        mean_tmin = df.groupby('_mo')[tmin_col].mean()
-        mean_tavg = df.groupby('_mo')['_tavg'].mean()
-        std_tavg = df.groupby('_mo')['_tavg'].std()
-        max_tmax = df.groupby('_mo')[tmax_col].max()
-        min_tmin = df.groupby('_mo')[tmin_col].min()
+        temp_stats = (
+            pd.DataFrame({'tmax': df[tmax_col], 'tmin': df[tmin_col],
+                          'tavg': (df[tmax_col] + df[tmin_col]) / 2})
+              .groupby(mo)
+              .agg(mean_tmax=('tmax', 'mean'), mean_tmin=('tmin', 'mean'),
+                   mean_tavg=('tavg', 'mean'), std_tavg=('tavg', 'std'),
+                   max_tmax=('tmax', 'max'), min_tmin=('tmin', 'min'))
+        )
+        mean_tmax = temp_stats['mean_tmax']
+        mean_tmin = temp_stats['mean_tmin']
+        mean_tavg = temp_stats['mean_tavg']
+        std_tavg = temp_stats['std_tavg']
+        max_tmax = temp_stats['max_tmax']
+        min_tmin = temp_stats['min_tmin']
 
         monthly['temperature'] = {
             int(m): {
@@ -38,6 +38,7 @@ for _p in (os.path.join(_PARENT, "fetch_data", "preprocess_data"),
 
 from preprocess_data import preprocess_data            
 from utils.models    import ClimateVariable, SoilVariable  
+from sources.utils.settings import set_logging
 
 # Variables treated as accumulations (totals, not means / min / max)
 ACCUMULATION_VARS = {"precipitation", "precip", "rain", "rainfall"}
@@ -124,7 +125,9 @@ def _fetch_source(source: str, lat: float, lon: float,
             and date_from is not None
             and date_to is not None):
         dates = pd.date_range(start=date_from, end=date_to, freq="D")
-        broadcast = pd.concat([df] * len(dates), ignore_index=True)
+        # One positional take repeats the static row(s) for every date,
+        # instead of concatenating one DataFrame object per day.
+        broadcast = df.iloc[np.tile(np.arange(len(df)), len(dates))].reset_index(drop=True)
         broadcast.insert(0, "date", dates)
         df = broadcast
     return df
@@ -489,6 +492,24 @@ def compare_sources(sources, lat=None, lon=None, start=None, end=None,
         export_data(df, "input_file", output_dir)
         return results
 
+    # Plain (non-NEX) sources are independent, I/O-bound fetches: start them
+    # all at once so wall time is the slowest source rather than the sum.
+    # Results (or the exception) are consumed in input order below.
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _prefetch(src):
+        try:
+            return _fetch_source(src, lat, lon, start, end), None
+        except Exception as exc:
+            return None, exc
+
+    plain = [s for s in dict.fromkeys(sources)
+             if s in VALID_SOURCES and s != "nex_gddp"]
+    prefetched = {}
+    if len(plain) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(plain), 8)) as ex:
+            prefetched = dict(zip(plain, ex.map(_prefetch, plain)))
+
     for source in sources:
         if source not in VALID_SOURCES:
             print(f"  ⚠️   Unknown source '{source}' — skipping. "
@@ -559,7 +580,12 @@ def compare_sources(sources, lat=None, lon=None, start=None, end=None,
                           f"{', '.join(per_model)}")
                     result_key = f"nex_gddp_ensemble_{scenario_key}"
             else:
-                df = _fetch_source(source, lat, lon, start, end)
+                if source in prefetched:
+                    df, err = prefetched.pop(source)
+                    if err is not None:
+                        raise err
+                else:
+                    df = _fetch_source(source, lat, lon, start, end)
                 result_key = source
 
             if df is None or df.empty or len(df.columns) <= 1:
@@ -712,6 +738,7 @@ def main():
         ),
     )
     args = parser.parse_args()
+    set_logging()
 
     if args.sources and (args.lat is None or args.lon is None):
         parser.error("--lat and --lon are required when using --sources")
@@ -29,6 +29,7 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.insert(0, project_root)
 
 from climate_tookit.climate_statistics.statistics import analyze_climate_statistics
+from sources.utils.settings import set_logging
 
 CATEGORIES   = ["precipitation", "temperature", "et0", "water_balance"]
 ANNUALIZABLE = {
@@ -346,6 +347,7 @@ def main() -> None:
                          "  Year-crossing : '11-01:02-28'"))
     p.add_argument("--output", default=None, help="Write JSON results to this path")
     args = p.parse_args()
+    set_logging()
 
     try:
         lat, lon = (float(x) for x in args.location.replace(" ", ",").split(","))
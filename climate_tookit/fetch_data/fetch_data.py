@@ -26,7 +26,7 @@ from transform_data.transform_data import (
 )
 from preprocess_data.preprocess_data import preprocess_data
 from sources.utils.models import ClimateDataset, ClimateVariable, SoilVariable
-from sources.utils.settings import Settings
+from sources.utils.settings import Settings, set_logging
 
 VALID_STAGES = ("raw", "transformed", "preprocessed")
 
@@ -205,6 +205,7 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    set_logging()
     sys.exit(main())
 
 # Examples:
@@ -18,6 +18,8 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'transform_data'))
 from transform_data import transform_data
 from sources.utils.models import ClimateVariable, ClimateDataset
 from sources.nex_gddp import AVAILABLE_MODELS as NEX_GDDP_MODELS
+from sources.nex_gddp import AVAILABLE_MODEL_SET as NEX_GDDP_MODEL_SET
+from sources.utils.settings import set_logging
 
 
 def resolve_models(model, models):
@@ -28,7 +30,7 @@ def resolve_models(model, models):
         if spec.lower() == 'all':
             return list(NEX_GDDP_MODELS)
         names = [m.strip() for m in spec.split(',') if m.strip()]
-        unknown = [m for m in names if m not in NEX_GDDP_MODELS]
+        unknown = [m for m in names if m not in NEX_GDDP_MODEL_SET]
         if unknown:
             raise ValueError(
                 f"Unknown model(s): {', '.join(unknown)}. "
@@ -51,8 +53,10 @@ def clean_climate_data(df: pd.DataFrame) -> pd.DataFrame:
 
     cleaned_df = df.copy()
 
-    if 'date' in cleaned_df.columns:
-        cleaned_df['date'] = pd.to_datetime(cleaned_df['date'])
+    # Sources that already deliver datetime64 dates skip the parse.
+    if ('date' in cleaned_df.columns
+            and not pd.api.types.is_datetime64_any_dtype(cleaned_df['date'])):
+        cleaned_df['date'] = pd.to_datetime(cleaned_df['date'], cache=True)
 
     numeric_columns = cleaned_df.select_dtypes(include=[np.number]).columns
 
@@ -118,14 +122,14 @@ def quality_control_checks(df: pd.DataFrame) -> pd.DataFrame:
                 qc_df.loc[mask, col] = np.nan
 
     if 'precipitation' in qc_df.columns:
-        small_negative = (qc_df['precipitation'] < 0) & (qc_df['precipitation'] > -0.01)
-        qc_df.loc[small_negative, 'precipitation'] = 0
-
-        large_negative = qc_df['precipitation'] <= -0.01
-        qc_df.loc[large_negative, 'precipitation'] = np.nan
-
-        extreme_precip = qc_df['precipitation'] > 500
-        qc_df.loc[extreme_precip, 'precipitation'] = np.nan
+        # Build the masks first, then overwrite in one branchless pass:
+        # large negatives and > 500 mm become NaN, tiny negatives (> -0.01)
+        # are clamped to 0. Cheaper than three indexed .loc writes.
+        precip  = qc_df['precipitation'].to_numpy(dtype=float)
+        invalid = (precip <= -0.01) | (precip > 500)
+        qc_df['precipitation'] = np.where(
+            invalid, np.nan, np.where(precip < 0, 0.0, precip)
+        )
 
     if 'wind_speed' in qc_df.columns:
         qc_df['wind_speed'] = qc_df['wind_speed'].abs()
@@ -192,6 +196,8 @@ def save_output(data, output_path, fmt):
 if __name__ == "__main__":
     import argparse
 
+    set_logging()
+
     parser = argparse.ArgumentParser(description="Preprocess climate data for analysis")
     parser.add_argument("--source", required=True)
     parser.add_argument("--lon", type=float)
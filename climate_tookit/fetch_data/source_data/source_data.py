@@ -16,9 +16,10 @@ from sources.tamsat import DownloadTAMSAT
 from sources.nasa_power import DownloadData as DownloadNASA
 from sources.nex_gddp import DownloadData as DownloadNEXGDDP
 from sources.nex_gddp import AVAILABLE_MODELS as NEX_GDDP_MODELS
+from sources.nex_gddp import AVAILABLE_MODEL_SET as NEX_GDDP_MODEL_SET
 from sources.soil_grid import DownloadData as DownloadSoilGrid
 from sources.utils.models import ClimateDataset, ClimateVariable, SoilVariable, Location
-from sources.utils.settings import Settings
+from sources.utils.settings import Settings, set_logging
 
 class SourceData:
     """The main class for retrieving data via a standardised interface."""
@@ -121,7 +122,7 @@ def resolve_models(model, models):
         if spec.lower() == 'all':
             return list(NEX_GDDP_MODELS)
         names = [m.strip() for m in spec.split(',') if m.strip()]
-        unknown = [m for m in names if m not in NEX_GDDP_MODELS]
+        unknown = [m for m in names if m not in NEX_GDDP_MODEL_SET]
         if unknown:
             raise ValueError(
                 f"Unknown model(s): {', '.join(unknown)}. "
@@ -223,6 +224,7 @@ def main():
     return 0
 
 if __name__ == "__main__":
+    set_logging()
     sys.exit(main())
 
  
@@ -12,9 +12,8 @@ import logging
 from datetime import date
  
 from .utils import models
-from .utils.settings import Settings, set_logging
+from .utils.settings import Settings
  
-set_logging()
 logger = logging.getLogger(__name__)
  
  
@@ -35,10 +34,6 @@ class DownloadData(models.DataDownloadBase):
             variables=variables,
         )
  
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
  
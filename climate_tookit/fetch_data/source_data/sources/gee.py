@@ -1,23 +1,24 @@
 """This module handles the downloading of climate data from climate sources
 hosted by Google Earth Engine (GEE)."""
 
+import functools
+import hashlib
 import logging
 import os
+import tempfile
+import threading
+import time
 from datetime import date, timedelta
-from typing import Optional, Union
+from pathlib import Path
+from typing import Callable, Optional, Union
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
-import ee
+import numpy as np
 import pandas as pd
 
 from .utils import models
 from .utils.models import Cadence
-from .utils.settings import Settings, set_logging
+from .utils.settings import Settings, _load_env
 
-set_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -26,17 +27,264 @@ logger = logging.getLogger(__name__)
 # not free. They MUST not run per-chunk — when get_gee_data_daily chunks a
 # 26-year range into dozens of sub-queries, repeating auth dominates the
 # runtime. Use this module-level guard so every entry point is idempotent.
+#
+# `ee` and `dotenv` are imported lazily rather than at module top: source_data
+# imports this module for every source, and the earthengine-api import alone
+# costs several hundred ms in runs that never touch GEE.
 _GEE_READY = False
+_GEE_INIT_LOCK = threading.Lock()
+ee = None
+
+# Earth Engine's high-volume endpoint is meant for automated, concurrent
+# getInfo() traffic like ours (chunk fan-out, ensemble thread pools); the
+# default endpoint is tuned for interactive use and throttles harder.
+_GEE_HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
 
 def _ensure_gee_initialized() -> None:
-    """Authenticate + initialize GEE exactly once per Python process."""
-    global _GEE_READY
+    """Import, authenticate + initialize GEE exactly once per Python process.
+
+    Thread-safe: ensemble runners call into GEE from a thread pool, and the
+    lock keeps concurrent first calls from authenticating more than once.
+    `ee.Authenticate()` is skipped when stored credentials already exist.
+    """
+    global _GEE_READY, ee
     if _GEE_READY:
         return
-    logger.info("Authenticating to GEE (first call)...")
-    ee.Authenticate()
-    ee.Initialize(project=os.getenv("GCP_PROJECT_ID"))
-    _GEE_READY = True
+    with _GEE_INIT_LOCK:
+        if _GEE_READY:
+            return
+        import ee as _ee
+
+        _load_env()
+        if not os.path.exists(_ee.oauth.get_credentials_path()):
+            logger.info("Authenticating to GEE (no stored credentials)...")
+            _ee.Authenticate()
+        _ee.Initialize(
+            project=os.getenv("GCP_PROJECT_ID"),
+            opt_url=_GEE_HIGH_VOLUME_URL,
+        )
+        ee = _ee
+        _GEE_READY = True
+
+
+class _RateLimiter:
+    """Thread-safe token bucket: at most `rate` acquisitions per `per` seconds.
+
+    Ensemble runners fan GEE requests out across a thread pool; without a
+    shared limiter a burst can exceed the per-user read-requests-per-minute
+    quota and every in-flight request fails at once.
+    """
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * self.rate / self.per,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.per / self.rate
+            time.sleep(wait)
+
+
+# Shared by every GEE-backed source in the process (see `_gee_get_info`).
+_GEE_RATE_LIMITER = _RateLimiter(rate=90, per=60)
+
+_GEE_MAX_ATTEMPTS = 5
+_GEE_BACKOFF_MAX_S = 30
+
+
+def _is_quota_error(err: Exception) -> bool:
+    """Detect GEE's rate-limit / quota rejections, which are worth retrying."""
+    msg = str(err).lower()
+    return ("429" in msg
+            or "too many requests" in msg
+            or "quota" in msg
+            or "rate limit" in msg)
+
+
+def _gee_get_info(obj):
+    """Call `obj.getInfo()` under the shared rate limiter.
+
+    Quota rejections are retried with exponential backoff (1, 2, 4, ... s,
+    capped at `_GEE_BACKOFF_MAX_S`); any other error propagates unchanged so
+    callers' own handling (e.g. overflow bisection) still applies.
+    """
+    for attempt in range(_GEE_MAX_ATTEMPTS):
+        _GEE_RATE_LIMITER.acquire()
+        try:
+            return obj.getInfo()
+        except Exception as e:
+            if not _is_quota_error(e) or attempt == _GEE_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(2 ** attempt, _GEE_BACKOFF_MAX_S)
+            logger.warning(
+                f"GEE quota hit (attempt {attempt + 1}/{_GEE_MAX_ATTEMPTS}); "
+                f"retrying in {delay}s: {e}"
+            )
+            time.sleep(delay)
+
+
+def _reduce_multi_band(
+    images: list,
+    location,
+    scale: Optional[float] = None,
+    crs: Optional[str] = None,
+    reducer=None,
+    max_pixels: Optional[float] = 1e9,
+    tile_scale: Optional[float] = None,
+    best_effort: bool = False,
+):
+    """Concatenate `images` into one multi-band image and reduce it once.
+
+    Returns the server-side ee.Dictionary (band -> value) so it can be used
+    inside mapped functions as well as fetched directly with `_gee_get_info`.
+    Callers must make band names unique across the images (select/rename).
+    """
+    reduce_args = {
+        "reducer": reducer if reducer is not None else ee.Reducer.mean(),
+        "geometry": location,
+    }
+    if scale is not None:
+        reduce_args["scale"] = scale
+    if crs is not None:
+        reduce_args["crs"] = crs
+    if max_pixels is not None:
+        reduce_args["maxPixels"] = max_pixels
+    if tile_scale is not None:
+        reduce_args["tileScale"] = tile_scale
+    if best_effort:
+        reduce_args["bestEffort"] = True
+
+    image = images[0] if len(images) == 1 else ee.Image.cat(images)
+    return image.reduceRegion(**reduce_args)
+
+
+# Static images (SoilGrids, OpenLandMap) never change between calls, so the
+# reduceRegion result for a given (image, point, scale, crs) is memoised for
+# the life of the process. `_handle_soil_grid` and repeated runs over the same
+# region then hit GEE once per distinct key instead of once per call.
+@functools.lru_cache(maxsize=256)
+def _reduce_region_static(
+    image_name: str,
+    lat: float,
+    lon: float,
+    scale: Optional[float],
+    crs: Optional[str],
+    location_name: Optional[str],
+    max_pixels: float,
+    tile_scale: float,
+) -> tuple:
+    """Run a mean reduceRegion on a static image; returns the result as
+    a tuple of (band, value) items so the cached value is immutable."""
+    _ensure_gee_initialized()
+
+    location = (
+        ee.Geometry.Point([lon, lat])
+        if location_name is None
+        else ee.Geometry.Point([lon, lat], {"location": location_name})
+    )
+    image = ee.Image(image_name)
+    expression = image.reduceRegion(
+        reducer=ee.Reducer.mean(),
+        geometry=location,
+        scale=scale,
+        maxPixels=max_pixels,
+        crs=crs,
+        bestEffort=True,
+        tileScale=tile_scale,
+    )
+    result = _gee_get_info(expression)
+    return tuple(result.items()) if result else ()
+
+
+def clear_gee_cache(disk: bool = False) -> None:
+    """Drop memoised static reduceRegion results (e.g. after an asset update
+    or to force a fresh fetch in a long-lived notebook session). With
+    `disk=True` the on-disk result cache (`GEE_CACHE_DIR`) is emptied too."""
+    _reduce_region_static.cache_clear()
+    if not disk:
+        return
+    cache_dir = _gee_cache_dir()
+    if cache_dir is not None:
+        for path in cache_dir.glob("*.csv"):
+            path.unlink(missing_ok=True)
+
+
+# Optional on-disk cache of fetched DataFrames, enabled by pointing
+# GEE_CACHE_DIR (env or .env) at a directory, e.g. outputs/cache/gee. Re-running
+# an analysis over the same image/point/date range then reads a local CSV
+# instead of going back to GEE. Disabled when the variable is unset.
+#
+# Only windows that ended at least GEE_CACHE_MIN_AGE_DAYS ago are cached:
+# ERA5/AgERA5 and IMERG publish with a lag of days to months, so a window
+# reaching towards the present comes back with missing (NaN) recent days
+# that would otherwise stay pinned in the cache after the data appears.
+GEE_CACHE_MIN_AGE_DAYS = 120
+
+
+def _gee_cache_dir() -> Optional[Path]:
+    _load_env()
+    cache_dir = os.getenv("GEE_CACHE_DIR")
+    if not cache_dir:
+        return None
+    path = Path(cache_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _gee_disk_cached(
+    key: tuple,
+    fetch: Callable[[], pd.DataFrame],
+    no_cache: bool = False,
+    date_to: Optional[date] = None,
+) -> pd.DataFrame:
+    """Return the cached DataFrame for `key`, or call `fetch()` and store it.
+
+    Results without any values (failed or out-of-coverage fetches, or a
+    date grid whose value columns are all NaN) are never written, so a
+    transient gap isn't pinned in the cache. When `date_to` is given the
+    cache is bypassed for windows ending within GEE_CACHE_MIN_AGE_DAYS.
+    """
+    recent = (
+        date_to is not None
+        and date_to > date.today() - timedelta(days=GEE_CACHE_MIN_AGE_DAYS)
+    )
+    cache_dir = None if no_cache or recent else _gee_cache_dir()
+    if cache_dir is None:
+        return fetch()
+
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+    path = cache_dir / f"{key[0]}_{digest}.csv"
+    if path.exists():
+        try:
+            df = pd.read_csv(path)
+            logger.info(f"GEE cache hit: {path.name}")
+            return df
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable GEE cache file {path}: {e}")
+
+    df = fetch()
+    values = df.drop(columns="date", errors="ignore")
+    if not values.empty and values.notna().to_numpy().any():
+        # Write-then-rename so concurrent readers never see a partial file.
+        fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+        os.close(fd)
+        df.to_csv(tmp_path, index=False)
+        os.replace(tmp_path, path)
+    return df
 
 
 class DownloadData(models.DataDownloadBase):
@@ -56,12 +304,28 @@ class DownloadData(models.DataDownloadBase):
             variables=variables,
         )
 
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
+        self._var_map: Optional[tuple[int, dict]] = None
+
+    def _variable_map(self, data_settings) -> dict:
+        """Map each requested variable name to its settings entry (a
+        `VariableMeta` for climate sources, a band string for soil).
+
+        Resolved once per settings object and reused by every code path in
+        this class that needs the variable -> band/scale lookup.
+        """
+        if self._var_map is None or self._var_map[0] != id(data_settings):
+            self._var_map = (id(data_settings), {
+                v.name: getattr(data_settings.variable, v.name, None)
+                for v in self.variables
+            })
+        return self._var_map[1]
+
+    @staticmethod
+    def _band_of(meta) -> Optional[str]:
+        """Band name from a settings entry (VariableMeta or plain string)."""
+        return getattr(meta, "band", meta)
 
     def download_precipitation(self):
         raise NotImplementedError
@@ -93,34 +357,30 @@ class DownloadData(models.DataDownloadBase):
         location_name: Optional[str] = None,
         max_pixels: float = 1e9,
         tile_scale: float = 1,
+        no_cache: bool = False,
     ) -> pd.DataFrame:
         """Uses the Google Earth Engine (GEE) API to retrieve static data
-        from datasets that don't have temporal components (like SoilGrids)."""
-        _ensure_gee_initialized()
+        from datasets that don't have temporal components (like SoilGrids).
 
-        lat, lon = location_coord
-        location = (
-            ee.Geometry.Point([lon, lat])
-            if location_name is None
-            else ee.Geometry.Point([lon, lat], {"location": location_name})
-        )
+        Results are cached per (image, coordinate, scale, crs), so repeated
+        requests for the same point do not re-issue the reduceRegion."""
+        lat, lon = round(float(location_coord[0]), 6), round(float(location_coord[1]), 6)
 
         logger.info(f"Retrieving information from GEE Image: {image_name}")
 
-        try:
-            image = ee.Image(image_name)
-            expression = image.reduceRegion(
-                reducer=ee.Reducer.mean(),
-                geometry=location,
-                scale=scale,
-                maxPixels=max_pixels,
-                crs=crs,
-                bestEffort=True,
-                tileScale=tile_scale,
+        def fetch() -> pd.DataFrame:
+            result = _reduce_region_static(
+                image_name, lat, lon, scale, crs, location_name, max_pixels, tile_scale,
             )
+            return pd.DataFrame([dict(result)]) if result else pd.DataFrame()
 
-            result = expression.getInfo()
-            return pd.DataFrame([result]) if result else pd.DataFrame()
+        try:
+            return _gee_disk_cached(
+                ("static", image_name, lat, lon, scale, crs, location_name,
+                 max_pixels, tile_scale),
+                fetch,
+                no_cache,
+            )
 
         except Exception as e:
             logger.error(f"Error retrieving static data from GEE: {e}")
@@ -171,6 +431,11 @@ class DownloadData(models.DataDownloadBase):
                 .filterDate(start, end)
                 .filterBounds(location)
             )
+            # Reduce only the requested bands. Multi-band daily products
+            # (AgERA5 carries ~150 bands) otherwise compute and ship every
+            # band per day just for the client to discard most of them.
+            if bands:
+                collection = collection.select(bands)
 
         def extract(image):
             reduce_args = {
@@ -194,16 +459,26 @@ class DownloadData(models.DataDownloadBase):
         feature_collection = collection.map(extract)
 
         # Single server call for result rather than one per day
-        result = feature_collection.getInfo()
+        result = _gee_get_info(feature_collection)
 
         features = result.get("features", [])
-        records = [f["properties"] for f in features]
-
-        df = pd.DataFrame(records) if records else pd.DataFrame()
+        df = self._features_to_frame(features)
+
+        # Drop features whose reduction came back empty (masked pixel, no
+        # data) in one vectorised pass; the full-range reindex below restores
+        # those days as NaN. An all-empty result is left intact so its
+        # columns survive.
+        value_cols = df.columns.drop("date", errors="ignore")
+        if len(value_cols):
+            has_data = df[value_cols].notna().any(axis=1)
+            if has_data.any() and not has_data.all():
+                df = df[has_data]
 
         if not df.empty:
-            logger.info(f"=== GEE RETURNED COLUMNS: {list(df.columns)}")
-            logger.info(f"=== SAMPLE ROW (first): {df.iloc[0].to_dict()}")
+            # Diagnostics only; skip building the row dict unless INFO is on.
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=== GEE RETURNED COLUMNS: %s", list(df.columns))
+                logger.info("=== SAMPLE ROW (first): %s", df.iloc[0].to_dict())
 
             df = df.sort_values("date").reset_index(drop=True)
 
@@ -218,7 +493,9 @@ class DownloadData(models.DataDownloadBase):
 
             # Ensure full daily index (GEE skips missing days)
             full_range = pd.date_range(from_date, to_date, freq="D")
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
+            # Dates arrive as "YYYY-MM-dd" from `image.date().format(...)`;
+            # an explicit format skips per-string format inference.
+            df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce", cache=True)
 
             df = (
                 df.set_index("date")
@@ -252,14 +529,15 @@ class DownloadData(models.DataDownloadBase):
     # comfortably under GEE's 5000 ceiling. 26 years -> 3 chunks.
     _GEE_DEFAULT_CHUNK_DAYS = 4380
     _GEE_MIN_CHUNK_DAYS = 7                  # don't bisect smaller than this
+    _GEE_MAX_CHUNK_WORKERS = 4               # concurrent chunk fetches per request
 
     def _daily_aggregated_collection(self, image_name, start, end, location,
                                      bands: Optional[list[str]] = None):
         """
         Build a server-side daily ImageCollection from a sub-daily source.
 
-        For each calendar day in [start, end), filters the raw sub-daily
-        collection to that day and reduces it with the source-appropriate
+        For each calendar day in [start, end) that has at least one frame,
+        filters the raw sub-daily collection to that day and reduces it with the source-appropriate
         reducer (`sum` for precipitation accumulators like IMERG, `mean`
         otherwise). The result is an ImageCollection with one image per
         day, so the downstream `collection.map(extract)` returns one
@@ -275,8 +553,6 @@ class DownloadData(models.DataDownloadBase):
         collection homogeneous and also lighter to compute.
         """
         reducer_name = self._GEE_DAILY_AGG_REDUCER.get(image_name, "mean")
-        n_days = end.difference(start, "day").floor()
-        days_seq = ee.List.sequence(0, n_days.subtract(1))
         raw = (
             ee.ImageCollection(image_name)
             .filterDate(start, end)
@@ -285,15 +561,24 @@ class DownloadData(models.DataDownloadBase):
         if bands:
             raw = raw.select(bands)
 
-        def daily_image(day_offset):
-            day_offset = ee.Number(day_offset)
-            d      = start.advance(day_offset, "day")
+        # Only build a daily image for days that actually have frames. Days
+        # outside the collection's coverage (e.g. past the IMERG latency edge)
+        # would otherwise each cost a filter + empty reduce; the caller's
+        # full-range reindex restores them as NaN.
+        days_present = (
+            ee.List(raw.aggregate_array("system:time_start"))
+            .map(lambda ms: ee.Date(ms).format("YYYY-MM-dd"))
+            .distinct()
+        )
+
+        def daily_image(day_str):
+            d      = ee.Date(day_str)
             d_next = d.advance(1, "day")
             slice_ = raw.filterDate(d, d_next)
             agg = slice_.sum() if reducer_name == "sum" else slice_.mean()
             return agg.set("system:time_start", d.millis())
 
-        return ee.ImageCollection.fromImages(days_seq.map(daily_image))
+        return ee.ImageCollection.fromImages(days_present.map(daily_image))
 
     @staticmethod
     def _is_collection_overflow(err: Exception) -> bool:
@@ -316,15 +601,17 @@ class DownloadData(models.DataDownloadBase):
         cadence: Cadence = Cadence.daily,
         tile_scale: float = 1,
         bands: Optional[list[str]] = None,
+        no_cache: bool = False,
     ) -> pd.DataFrame:
         """
         Retrieve daily data from a GEE ImageCollection with adaptive chunking.
         - All sources use the same large initial chunk (4380 days); sub-daily sources are pre-aggregated to daily server-side so element counts
           match daily.
         - On a 5000-element / memory error the offending chunk is bisected and retried recursively, down to `_GEE_MIN_CHUNK_DAYS`.
-        - Failed chunks return empty DataFrames (logged); successful chunks are concatenated.
+        - Chunks are fetched concurrently (up to `_GEE_MAX_CHUNK_WORKERS`); failed chunks return empty DataFrames (logged) and successful
+          chunks are concatenated in date order.
+        - Results are stored in the optional on-disk cache (`GEE_CACHE_DIR`) unless `no_cache` is set.
         """
-        _ensure_gee_initialized()
         logger.info(f"Retrieving information from GEE Image: {image_name}")
 
         if cadence != Cadence.daily:
@@ -337,21 +624,77 @@ class DownloadData(models.DataDownloadBase):
             logger.warning("from_date is after to_date. Returning empty DataFrame.")
             return pd.DataFrame()
 
+        lat, lon = location_coord
+        return _gee_disk_cached(
+            ("daily", image_name, round(float(lat), 6), round(float(lon), 6),
+             from_date.isoformat(), to_date.isoformat(), scale, crs,
+             location_name, max_pixels, tile_scale, tuple(bands or ())),
+            lambda: self._get_gee_data_daily_chunked(
+                image_name=image_name,
+                location_coord=location_coord,
+                from_date=from_date,
+                to_date=to_date,
+                scale=scale,
+                crs=crs,
+                location_name=location_name,
+                max_pixels=max_pixels,
+                tile_scale=tile_scale,
+                bands=bands,
+            ),
+            no_cache,
+            date_to=to_date,
+        )
+
+    def _get_gee_data_daily_chunked(
+        self,
+        image_name: str,
+        location_coord: tuple[float, float],
+        from_date: date,
+        to_date: date,
+        scale: Optional[float],
+        crs: Optional[str],
+        location_name: Optional[str],
+        max_pixels: float,
+        tile_scale: float,
+        bands: Optional[list[str]],
+    ) -> pd.DataFrame:
+        """Split [from_date, to_date] into chunk windows and fetch them."""
+        total_days = (to_date - from_date).days
+
         # All sources use the same large chunk: sub-daily sources are collapsed to daily server-side (see `_GEE_DAILY_AGG_REDUCER` and
         # `_daily_aggregated_collection`), so element counts match daily.
         chunk_size = self._GEE_DEFAULT_CHUNK_DAYS
+
+        # Fast path: the whole range fits in one chunk (the common case), so
+        # go straight to the fetch without building windows or a pool.
+        if total_days < chunk_size:
+            return self._fetch_chunk_with_bisect(
+                image_name=image_name,
+                location_coord=location_coord,
+                from_date=from_date,
+                to_date=to_date,
+                scale=scale,
+                crs=crs,
+                location_name=location_name,
+                max_pixels=max_pixels,
+                tile_scale=tile_scale,
+                bands=bands,
+            )
+
         logger.info(f"GEE chunking: image={image_name} initial chunk_size={chunk_size}d "
                     f"over {total_days+1}d total")
 
-        chunks: list[pd.DataFrame] = []
-        chunk_start = from_date
-        while chunk_start <= to_date:
-            chunk_end = min(chunk_start + timedelta(days=chunk_size - 1), to_date)
-            df_chunk = self._fetch_chunk_with_bisect(
+        windows: list[tuple[date, date]] = [
+            (chunk_start, min(chunk_start + timedelta(days=chunk_size - 1), to_date))
+            for chunk_start in pd.date_range(from_date, to_date, freq=f"{chunk_size}D").date
+        ]
+
+        def fetch(window: tuple[date, date]) -> pd.DataFrame:
+            return self._fetch_chunk_with_bisect(
                 image_name=image_name,
                 location_coord=location_coord,
-                from_date=chunk_start,
-                to_date=chunk_end,
+                from_date=window[0],
+                to_date=window[1],
                 scale=scale,
                 crs=crs,
                 location_name=location_name,
@@ -359,14 +702,47 @@ class DownloadData(models.DataDownloadBase):
                 tile_scale=tile_scale,
                 bands=bands,
             )
-            if not df_chunk.empty:
-                chunks.append(df_chunk)
-            chunk_start = chunk_end + timedelta(days=1)
 
+        # Each window is an independent getInfo() that spends most of its
+        # time waiting on the server, so they are fetched concurrently.
+        # `_gee_get_info` keeps the fan-out under the quota, and `map`
+        # preserves chronological order.
+        from concurrent.futures import ThreadPoolExecutor
+        workers = min(len(windows), self._GEE_MAX_CHUNK_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(fetch, windows))
+
+        chunks = [df_chunk for df_chunk in results if not df_chunk.empty]
+        del results
         if not chunks:
             return pd.DataFrame()
+        # Ranges under `_GEE_DEFAULT_CHUNK_DAYS` arrive as one frame; return it
+        # as-is rather than paying for a full concat copy.
+        if len(chunks) == 1:
+            return chunks[0]
         return pd.concat(chunks, ignore_index=True)
 
+    @staticmethod
+    def _features_to_frame(features: list) -> pd.DataFrame:
+        """Build a DataFrame from reduceRegion features, one column at a time.
+
+        Every value column is materialised as a single float64 array (masked
+        days -> NaN), so pandas stores the bands as one consolidated numeric
+        block instead of inferring dtypes row by row from a list of dicts;
+        the `date` strings stay a separate object column.
+        """
+        if not features:
+            return pd.DataFrame()
+        props = [f["properties"] for f in features]
+        # Union of keys in first-seen order: a band masked on the first day
+        # must still get its column.
+        names = list(dict.fromkeys(k for p in props for k in p))
+        columns = {}
+        for name in names:
+            values = [p.get(name) for p in props]
+            columns[name] = values if name == "date" else np.array(values, dtype=np.float64)
+        return pd.DataFrame(columns)
+
     def _fetch_chunk_with_bisect(
         self,
         image_name: str,
@@ -426,6 +802,8 @@ class DownloadData(models.DataDownloadBase):
             parts = [d for d in (left, right) if not d.empty]
             if not parts:
                 return pd.DataFrame()
+            if len(parts) == 1:
+                return parts[0]
             return pd.concat(parts, ignore_index=True)
 
     def get_gee_data_monthly(
@@ -439,9 +817,35 @@ class DownloadData(models.DataDownloadBase):
         location_name: Optional[str] = None,
         max_pixels: float = 1e9,
         tile_scale: float = 1,
+        no_cache: bool = False,
     ):
         """Uses the GEE API to retrieve weather information for monthly-cadence datasets."""
+        lat, lon = location_coord
+        return _gee_disk_cached(
+            ("monthly", image_name, round(float(lat), 6), round(float(lon), 6),
+             from_date.isoformat(), to_date.isoformat(), scale, crs,
+             location_name, max_pixels, tile_scale),
+            lambda: self._get_gee_data_monthly_uncached(
+                image_name, location_coord, from_date, to_date,
+                scale, crs, location_name, max_pixels, tile_scale,
+            ),
+            no_cache,
+            date_to=to_date,
+        )
 
+    def _get_gee_data_monthly_uncached(
+        self,
+        image_name: str,
+        location_coord: tuple[float, float],
+        from_date: date,
+        to_date: date,
+        scale: Optional[float],
+        crs: Optional[str],
+        location_name: Optional[str],
+        max_pixels: float,
+        tile_scale: float,
+    ) -> pd.DataFrame:
+        """Build and run the server-side monthly reduction (no caching)."""
         _ensure_gee_initialized()
 
         lat, lon = location_coord
@@ -468,36 +872,28 @@ class DownloadData(models.DataDownloadBase):
             current_month_start = start_date.advance(month_offset, "month")
             current_month_end = current_month_start.advance(1, "month")
 
-            monthly_images = collection.filterDate(current_month_start, current_month_end)
-            monthly_image = monthly_images.mean()
-            reduce_args = {
-                "reducer": ee.Reducer.first(),
-                "geometry": location,
-            }
-
-            if scale is not None:
-                reduce_args["scale"] = scale
-
-            if crs is not None:
-                reduce_args["crs"] = crs
-
-            if max_pixels is not None:
-                reduce_args["maxPixels"] = max_pixels
-
-            if tile_scale is not None:
-                reduce_args["tileScale"] = tile_scale
-
-            values = monthly_image.reduceRegion(**reduce_args)
+            monthly_image = collection.filterDate(current_month_start, current_month_end).mean()
+            values = _reduce_multi_band(
+                [monthly_image],
+                location,
+                scale=scale,
+                crs=crs,
+                reducer=ee.Reducer.first(),
+                max_pixels=max_pixels,
+                tile_scale=tile_scale,
+            )
 
             return ee.Feature(None, values).set(
                 "date", current_month_start.format("YYYY-MM-dd")
             )
 
         logger.info(f"Retrieving information from GEE Image: {image_name}")
-        features = months.map(get_single_data)
-        result = features.getInfo()
+        # Wrap the mapped list as a FeatureCollection so getInfo() returns one
+        # compact collection payload rather than a serialised list of features.
+        features = ee.FeatureCollection(months.map(get_single_data))
+        result = _gee_get_info(features)
 
-        data_list = [f["properties"] for f in result] if result else []
+        data_list = [f["properties"] for f in result.get("features", [])] if result else []
         df = pd.DataFrame(data_list) if data_list else pd.DataFrame()
 
         if not df.empty:
@@ -506,12 +902,14 @@ class DownloadData(models.DataDownloadBase):
         return df
 
     def _handle_soil_grid(self, data_settings) -> pd.DataFrame:
-        """Handle soil_grid with multiple images."""
-        result_data = {}
-
-        for variable in self.variables:
-            var_name = variable.name
+        """Handle soil_grid with multiple images.
 
+        All requested properties are reduced in one server call over a
+        concatenated image; if that fails (e.g. a band is missing from one
+        asset) each image is fetched on its own instead.
+        """
+        targets = []
+        for var_name, mapped_col in self._variable_map(data_settings).items():
             gee_image = (
                 data_settings.gee_images.get(var_name)
                 if isinstance(data_settings.gee_images, dict)
@@ -521,39 +919,112 @@ class DownloadData(models.DataDownloadBase):
                 logger.warning(f"No GEE image mapping found for variable '{var_name}'")
                 continue
 
-            mapped_col = getattr(data_settings.variable, var_name, None)
             if not mapped_col:
                 logger.warning(f"No variable mapping found for '{var_name}'")
                 continue
 
+            targets.append((var_name, gee_image, mapped_col))
+
+        result_data = {}
+        if targets:
+            try:
+                result_data = self._soil_grid_batched(targets, data_settings.resolution)
+            except Exception as e:
+                logger.warning(
+                    f"Batched soil_grid reduceRegion failed ({e}); "
+                    f"falling back to one request per image"
+                )
+                result_data = self._soil_grid_per_image(targets, data_settings.resolution)
+
+        if result_data:
+            logger.info(f"Successfully processed {len(result_data)} soil variables")
+            return pd.DataFrame([result_data])
+        else:
+            logger.warning("No soil data successfully retrieved")
+            return pd.DataFrame()
+
+    def _soil_grid_batched(self, targets: list[tuple[str, str, str]],
+                           scale: float) -> dict:
+        """Reduce every (var_name, image, band) target in a single reduceRegion.
+
+        Each image is narrowed to its mapped band and renamed to the variable
+        name, so assets sharing a band name (OpenLandMap's `b0`) don't clash
+        in the concatenated image.
+        """
+        _ensure_gee_initialized()
+
+        lat, lon = self.location_coord
+        location = ee.Geometry.Point([lon, lat])
+        logger.info(
+            f"Downloading {[name for name, _, _ in targets]} in one reduceRegion"
+        )
+
+        values = _gee_get_info(_reduce_multi_band(
+            [
+                ee.Image(gee_image).select([mapped_col]).rename([var_name])
+                for var_name, gee_image, mapped_col in targets
+            ],
+            location,
+            scale=scale,
+            best_effort=True,
+        )) or {}
+
+        result_data = {}
+        for var_name, _, mapped_col in targets:
+            value = values.get(var_name)
+            if value is None:
+                logger.warning(
+                    f"No data retrieved for {var_name} - column '{mapped_col}' not found"
+                )
+                continue
+            result_data[var_name] = value
+            logger.info(f"Successfully retrieved {var_name}: {value}")
+        return result_data
+
+    def _soil_grid_per_image(self, targets: list[tuple[str, str, str]],
+                             scale: float) -> dict:
+        """Fetch each (var_name, image, band) target with its own request.
+
+        The requests are independent and network-bound, so they run on a
+        small thread pool; `_gee_get_info` keeps them under the GEE quota.
+        """
+        def fetch_one(target: tuple[str, str, str]):
+            var_name, gee_image, mapped_col = target
             logger.info(f"Downloading {var_name} from {gee_image}")
 
             try:
                 var_data = self.get_gee_data_static(
                     image_name=gee_image,
                     location_coord=self.location_coord,
-                    scale=data_settings.resolution,
+                    scale=scale,
                 )
 
                 if not var_data.empty and mapped_col in var_data.columns:
-                    result_data[var_name] = var_data[mapped_col].iloc[0]
-                    logger.info(
-                        f"Successfully retrieved {var_name}: {result_data[var_name]}"
-                    )
-                else:
-                    logger.warning(
-                        f"No data retrieved for {var_name} - column '{mapped_col}' not found"
-                    )
+                    value = var_data[mapped_col].iloc[0]
+                    logger.info(f"Successfully retrieved {var_name}: {value}")
+                    return var_name, value
+                logger.warning(
+                    f"No data retrieved for {var_name} - column '{mapped_col}' not found"
+                )
 
             except Exception as e:
                 logger.error(f"Error downloading {var_name}: {e}")
+            return var_name, None
 
-        if result_data:
-            logger.info(f"Successfully processed {len(result_data)} soil variables")
-            return pd.DataFrame([result_data])
-        else:
-            logger.warning("No soil data successfully retrieved")
-            return pd.DataFrame()
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        result_data = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(targets))) as ex:
+            futs = [ex.submit(fetch_one, t) for t in targets]
+            for fut in as_completed(futs):
+                var_name, value = fut.result()
+                if value is not None:
+                    result_data[var_name] = value
+        # Keep columns in request order regardless of completion order.
+        return {
+            var_name: result_data[var_name]
+            for var_name, _, _ in targets
+            if var_name in result_data
+        }
 
     def download_variables(self) -> pd.DataFrame:
         """Download and process variables from the configured data source.
@@ -574,9 +1045,8 @@ class DownloadData(models.DataDownloadBase):
         if self.source.name == "soil_grid" and hasattr(data_settings, "gee_images"):
             logger.info("Using enhanced soil variable download with multiple GEE images")
             df_soil = self._handle_soil_grid(data_settings)
-            for v in self.variables:
-                mapped_col = data_settings.variable.get_band(v.name)
-                var_meta = getattr(data_settings.variable, v.name, None)
+            for var_meta in self._variable_map(data_settings).values():
+                mapped_col = self._band_of(var_meta)
                 if mapped_col in df_soil.columns and var_meta is not None:
                     scale = getattr(var_meta, "scale", 1.0)
                     df_soil[mapped_col] = df_soil[mapped_col] * scale
@@ -584,6 +1054,7 @@ class DownloadData(models.DataDownloadBase):
             return df_soil
 
         # Standard climate data handling
+        var_map = self._variable_map(data_settings)
         try:
             if data_settings.cadence == "static":
                 climate_data = self.get_gee_data_static(
@@ -601,11 +1072,9 @@ class DownloadData(models.DataDownloadBase):
                 )
             else:
                 # Bands we actually need (drops null-mapped variables). For sub-daily sources these restrict the server-side daily
-                # aggregation to a homogeneous, lighter band set; ignored by daily-cadence sources.
+                # aggregation to a homogeneous, lighter band set; for daily-cadence sources they limit the per-day reduceRegion.
                 wanted_bands = [
-                    b for b in (data_settings.variable.get_band(v.name)
-                                for v in self.variables)
-                    if b
+                    b for b in map(self._band_of, var_map.values()) if b
                 ]
                 climate_data = self.get_gee_data_daily(
                     image_name=data_settings.gee_image,
@@ -623,35 +1092,33 @@ class DownloadData(models.DataDownloadBase):
             logger.warning("No data retrieved from GEE")
             return pd.DataFrame()
 
-        # Map columns to variable names
-        dataset_cols = list(climate_data.columns)
-        req_vars = [v.name for v in self.variables]
-
-        available_cols = []
-        missing_vars = []
-
-        for v in self.variables:
-            mapped_col = data_settings.variable.get_band(v.name)
-            if mapped_col and mapped_col in climate_data.columns:
-                available_cols.append(mapped_col)
-            else:
-                logger.warning(f"{self.source.name.upper()} does not have {v.name} data")
-                missing_vars.append(v.name)
-
-        logger.info(f"Available columns: {dataset_cols}")
-        logger.info(f"Requested variables: {req_vars}")
-        logger.info(f"Mapped available columns: {available_cols}")
-        if missing_vars:
-            logger.info(f"Missing variables: {missing_vars}")
-
-        # Apply scaling for each variable that has a scale factor
-        for v in self.variables:
-            mapped_col = data_settings.variable.get_band(v.name)
-            var_meta = getattr(data_settings.variable, v.name, None)
-            if mapped_col in climate_data.columns and var_meta is not None:
-                scale = getattr(var_meta, "scale", 1.0)
+        # Map columns to variable names. Resolve each variable's band once and
+        # test membership against a set rather than scanning the Index.
+        col_set = set(climate_data.columns)
+        mapping = {name: self._band_of(meta) for name, meta in var_map.items()}
+
+        available_cols = [c for c in mapping.values() if c and c in col_set]
+        missing_vars = [n for n, c in mapping.items() if not c or c not in col_set]
+        for name in missing_vars:
+            logger.warning(f"{self.source.name.upper()} does not have {name} data")
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Available columns: %s", list(climate_data.columns))
+            logger.info("Requested variables: %s", list(mapping))
+            logger.info("Mapped available columns: %s", available_cols)
+            if missing_vars:
+                logger.info("Missing variables: %s", missing_vars)
+
+        # Apply scaling for each variable that has a scale factor. Most bands
+        # carry the default 1.0; skip those rather than allocating a copy of
+        # the column just to multiply it by one.
+        for name, mapped_col in mapping.items():
+            if mapped_col in col_set:
+                scale = getattr(var_map[name], "scale", 1.0)
+                if scale == 1.0:
+                    continue
                 climate_data[mapped_col] = climate_data[mapped_col] * scale
                 logger.info(f"Applied scaling to {mapped_col} (scale={scale})")
 
-        base_cols = ["date"] if "date" in climate_data.columns else []
-        return climate_data[base_cols + available_cols]
\ No newline at end of file
+        cols = ["date", *available_cols] if "date" in col_set else available_cols
+        return climate_data[cols]
\ No newline at end of file
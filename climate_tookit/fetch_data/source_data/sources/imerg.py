@@ -13,12 +13,12 @@ import os
 import platform
 import shutil
 from datetime import date
+from pathlib import Path
 
 
 from .utils import models
-from .utils.settings import Settings, set_logging
+from .utils.settings import Settings
 
-set_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -39,34 +39,37 @@ class DownloadData(models.DataDownloadBase):
             variables=variables,
         )
 
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
 
     @staticmethod
     def create_access_files():
-        """Creates .urs_cookies and .dodsrc files to access the NASA website"""
+        """Creates .urs_cookies and .dodsrc files to access the NASA website.
+
+        Existing files are left alone, so warm runs do no disk writes and an
+        established cookie jar is not wiped."""
 
         homeDir = os.path.expanduser("~") + os.sep
+        cookies = Path(homeDir, ".urs_cookies")
+        dodsrc = Path(homeDir, ".dodsrc")
+        dodsrc_content = (
+            "HTTP.COOKIEJAR={}.urs_cookies\n".format(homeDir)
+            + "HTTP.NETRC={}.netrc".format(homeDir)
+        )
 
         # Create .urs_cookies and .dodsrc files
-        with open(homeDir + ".urs_cookies", "w") as file:
-            file.write("")
-            file.close()
-        with open(homeDir + ".dodsrc", "w") as file:
-            file.write("HTTP.COOKIEJAR={}.urs_cookies\n".format(homeDir))
-            file.write("HTTP.NETRC={}.netrc".format(homeDir))
-            file.close()
-
-        print("Saved .urs_cookies and .dodsrc to:", homeDir)
+        if not cookies.exists():
+            cookies.write_text("")
+        if not dodsrc.exists() or dodsrc.read_text() != dodsrc_content:
+            dodsrc.write_text(dodsrc_content)
+            print("Saved .urs_cookies and .dodsrc to:", homeDir)
 
         # Copy dodsrc to working directory in Windows
         if platform.system() == "Windows":
-            shutil.copy2(homeDir + ".dodsrc", os.getcwd())
-            print("Copied .dodsrc to:", os.getcwd())
+            target = Path(os.getcwd(), ".dodsrc")
+            if not target.exists() or target.stat().st_mtime < dodsrc.stat().st_mtime:
+                shutil.copy2(dodsrc, target)
+                print("Copied .dodsrc to:", os.getcwd())
 
     def download_precipitation(self):
         raise NotImplementedError
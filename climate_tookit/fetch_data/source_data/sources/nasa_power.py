@@ -7,17 +7,111 @@ source module and every caller in the toolkit (compare_datasets, climatology,
 calculate_hazards, season_analysis, etc.).
 """
 
+import hashlib
 import logging
+import os
+import tempfile
+import numpy as np
 import pandas as pd
 import requests
-from datetime import date
+from datetime import date, timedelta
+from pathlib import Path
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .utils import models
-from .utils.settings import Settings
-from collections import defaultdict
+from .utils.settings import Settings, _load_env
+
+# orjson is an optional speedup for multi-year responses (tens of thousands of
+# floats); the stdlib parser is used when it isn't installed. Both accept
+# bytes and bytearray.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
+# Calendar years per POWER sub-request. The daily point endpoint serves
+# multi-year ranges in one response, so long records are split into a few
+# multi-year spans (fetched in parallel) rather than one request per year.
+NASA_POWER_CHUNK_YEARS = 5
+
+# Upper bound on one response body. A five-year span of every parameter is
+# well under 1 MB; anything far larger is a malformed request or an error
+# page, and is dropped before it is buffered and parsed.
+NASA_POWER_MAX_RESPONSE_BYTES = 20 * 1024 * 1024
+
+# Optional on-disk cache of raw POWER responses, enabled by pointing
+# NASA_POWER_CACHE_DIR (env or .env) at a directory. Only ranges ending at
+# least NASA_POWER_CACHE_MIN_AGE_DAYS ago are cached: older data is final,
+# while recent days are still near-real-time and may be revised.
+NASA_POWER_CACHE_MIN_AGE_DAYS = 90
+
+
+def _response_cache_path(url: str, date_to: date) -> Optional[Path]:
+    """Cache file for `url`, or None if caching is off or the data is recent."""
+    _load_env()
+    cache_dir = os.getenv("NASA_POWER_CACHE_DIR")
+    if not cache_dir or date_to > date.today() - timedelta(days=NASA_POWER_CACHE_MIN_AGE_DAYS):
+        return None
+    path = Path(cache_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return path / f"nasa_power_{digest}.json"
+
+# NASA POWER parameter code -> toolkit variable name. T2M is handled
+# separately as a fallback for the max/min temperature columns.
+_PARAMETER_TO_VARIABLE = {
+    "PRECTOTCORR": "precipitation",
+    "T2M_MAX": "max_temperature",
+    "T2M_MIN": "min_temperature",
+    "RH2M": "humidity",
+    "ALLSKY_SFC_SW_DWN": "solar_radiation",
+    "WS2M": "wind_speed",
+}
+
+# One pooled session per process: callers that build many DownloadData
+# objects (multi-site comparisons, per-year baselines) reuse the open TLS
+# connection instead of handshaking on every request. Transient 429/5xx
+# responses are retried with backoff by the adapter.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Connection": "keep-alive"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
+def _parameters_to_frame(raw_data: dict) -> pd.DataFrame:
+    """Build the code x date frame from POWER's {code: {YYYYMMDD: value}} maps.
+
+    Every parameter in a response shares one date key order, so each column
+    is filled straight into a float64 array with np.fromiter and the dates
+    become the index once, instead of pandas aligning every dict on its keys.
+    Falls back to the aligning constructor if the key orders differ or a
+    value is not numeric (e.g. null).
+    """
+    keys = list(next(iter(raw_data.values())))
+    if all(list(values) == keys for values in raw_data.values()):
+        try:
+            return pd.DataFrame(
+                {code: np.fromiter(values.values(), dtype=np.float64, count=len(keys))
+                 for code, values in raw_data.items()},
+                index=pd.Index(keys),
+            )
+        except (TypeError, ValueError):
+            pass
+    return pd.DataFrame(raw_data)
+
+
 class DownloadData(models.DataDownloadBase):
     def __init__(
         self,
@@ -35,19 +129,22 @@ class DownloadData(models.DataDownloadBase):
             date_from_utc=date_from_utc,
             date_to_utc=date_to_utc,
         )
-        self.location_coord = location_coord
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.variables = variables or []
         self.aggregation = aggregation
         self.settings = settings or Settings.load()
         self.source = source
+        # Requested variable names, resolved once: ordered for output
+        # columns, frozen for membership tests.
+        self._requested_vars = [v.name for v in self.variables]
+        self._var_names = frozenset(self._requested_vars)
+        self._param_codes: Optional[list[str]] = None
 
     def _get_parameter_codes(self) -> list[str]:
-        """Map requested variables to NASA POWER parameter codes."""
-        params = []
+        """Map requested variables to NASA POWER parameter codes (cached)."""
+        if self._param_codes is not None:
+            return self._param_codes
 
-        var_names = [v.name for v in self.variables]
+        params = []
+        var_names = self._var_names
 
         # NASA POWER has limited precipitation data (only PRECTOTCORR)
         if 'precipitation' in var_names:
@@ -68,20 +165,49 @@ class DownloadData(models.DataDownloadBase):
         if 'wind_speed' in var_names:
             params.append("WS2M")
 
+        self._param_codes = params
         return params
 
     def _fetch_daily_data(self) -> dict:
-        """Fetch DAILY data from NASA POWER API."""
+        """Fetch DAILY data from NASA POWER API.
+
+        Ranges longer than NASA_POWER_CHUNK_YEARS calendar years are split
+        into spans of that many years, fetched in parallel; their
+        per-parameter date->value maps are merged so callers see the same
+        shape as a single request.
+        """
         params = self._get_parameter_codes()
         if not params:
             raise ValueError("No valid parameters to request from NASA POWER.")
 
+        first, last = self.date_from_utc.year, self.date_to_utc.year
+        if last - first < NASA_POWER_CHUNK_YEARS:
+            return self._fetch_range(params, self.date_from_utc, self.date_to_utc)
+
+        ranges = [
+            (max(self.date_from_utc, date(year, 1, 1)),
+             min(self.date_to_utc, date(year + NASA_POWER_CHUNK_YEARS - 1, 12, 31)))
+            for year in range(first, last + 1, NASA_POWER_CHUNK_YEARS)
+        ]
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(ranges))) as ex:
+            parts = list(ex.map(lambda r: self._fetch_range(params, *r), ranges))
+
+        merged: dict = {}
+        for part in parts:
+            for var_code, values in part.items():
+                merged.setdefault(var_code, {}).update(values)
+        return merged
+
+    def _fetch_range(self, params: list[str], date_from: date, date_to: date) -> dict:
+        """Fetch one request's worth of DAILY data; {} on failure."""
         # Toolkit-wide convention: location_coord is (lat, lon).
         lat, lon = self.location_coord
 
         # Format dates as YYYYMMDD for daily data
-        start_date = self.date_from_utc.strftime("%Y%m%d")
-        end_date = self.date_to_utc.strftime("%Y%m%d")
+        start_date = date_from.strftime("%Y%m%d")
+        end_date = date_to.strftime("%Y%m%d")
 
         # CRITICAL: Use temporal-api=daily for daily data
         url = (
@@ -98,11 +224,35 @@ class DownloadData(models.DataDownloadBase):
         logger.info(f"NASA POWER URL: {url}")
         logger.info(f"NASA POWER Coordinates: lat={lat}, lon={lon}")  
 
+        cache_path = _response_cache_path(url, date_to)
+        if cache_path is not None and cache_path.exists():
+            try:
+                data = _json_loads(cache_path.read_bytes())
+                logger.info(f"NASA POWER cache hit: {cache_path.name}")
+                return data.get("properties", {}).get("parameter", {})
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable NASA POWER cache file {cache_path}: {e}")
+
         try:
-            resp = requests.get(url, timeout=60)
-            resp.raise_for_status()
-            data = resp.json()
-            return data.get("properties", {}).get("parameter", {})
+            with _SESSION.get(url, timeout=60, stream=True) as resp:
+                resp.raise_for_status()
+                body = bytearray()
+                for chunk in resp.iter_content(chunk_size=65536):
+                    body += chunk
+                    if len(body) > NASA_POWER_MAX_RESPONSE_BYTES:
+                        raise ValueError(
+                            f"NASA POWER response exceeds "
+                            f"{NASA_POWER_MAX_RESPONSE_BYTES} bytes; aborting"
+                        )
+            data = _json_loads(body)
+            parameters = data.get("properties", {}).get("parameter", {})
+            if cache_path is not None and parameters:
+                # Write-then-rename so concurrent readers never see a partial file.
+                fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_path.parent)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(body)
+                os.replace(tmp_path, cache_path)
+            return parameters
         except Exception as e:
             logger.error(f"Error fetching NASA POWER data: {e}")
             return {}
@@ -121,49 +271,23 @@ class DownloadData(models.DataDownloadBase):
             logger.warning("No data returned from NASA POWER")
             return pd.DataFrame()
 
-        data_by_date = defaultdict(dict)
-        available_vars = set()
-
-        for var_code, values in raw_data.items():
-            for dt_str, val in values.items():
-                if len(dt_str) == 8 and dt_str.isdigit():
-                    try:
-                        dt = pd.to_datetime(dt_str, format="%Y%m%d")
-
-                        if var_code == "PRECTOTCORR":
-                            data_by_date[dt]["precipitation"] = val
-                            available_vars.add("precipitation")
-                        elif var_code == "T2M_MAX":
-                            data_by_date[dt]["max_temperature"] = val
-                            available_vars.add("max_temperature")
-                        elif var_code == "T2M_MIN":
-                            data_by_date[dt]["min_temperature"] = val
-                            available_vars.add("min_temperature")
-                        elif var_code == "T2M":
-                            # Only use T2M if we don't have T2M_MAX/MIN
-                            if "max_temperature" not in data_by_date[dt]:
-                                data_by_date[dt]["max_temperature"] = val
-                            if "min_temperature" not in data_by_date[dt]:
-                                data_by_date[dt]["min_temperature"] = val
-                            available_vars.update(["max_temperature", "min_temperature"])
-                        elif var_code == "RH2M":
-                            data_by_date[dt]["humidity"] = val
-                            available_vars.add("humidity")
-                        elif var_code == "ALLSKY_SFC_SW_DWN":
-                            data_by_date[dt]["solar_radiation"] = val
-                            available_vars.add("solar_radiation")
-                        elif var_code == "WS2M":
-                            data_by_date[dt]["wind_speed"] = val
-                            available_vars.add("wind_speed")
-                    except Exception as e:
-                        logger.warning(f"Error parsing date {dt_str}: {e}")
-                        continue
-
-        df = pd.DataFrame([
-            {"date": dt, **vals} for dt, vals in sorted(data_by_date.items())
-        ])
-
-        requested_vars = [v.name for v in self.variables]
+        # One vectorised pass: columns are NASA parameter codes, the index is
+        # YYYYMMDD strings (anything else, e.g. monthly/annual keys, dropped).
+        raw = _parameters_to_frame(raw_data)
+        raw = raw[raw.index.astype(str).str.fullmatch(r"\d{8}")]
+        raw.index = pd.to_datetime(raw.index, format="%Y%m%d")
+        df = raw.sort_index().rename(columns=_PARAMETER_TO_VARIABLE)
+
+        # T2M only fills max/min temperature where T2M_MAX/T2M_MIN are absent.
+        if "T2M" in df.columns:
+            for col in ("max_temperature", "min_temperature"):
+                df[col] = df[col].combine_first(df["T2M"]) if col in df.columns else df["T2M"]
+            df = df.drop(columns="T2M")
+
+        available_vars = set(df.columns)
+        df = df.rename_axis("date").reset_index()
+
+        requested_vars = self._requested_vars
 
         for var in requested_vars:
             if var not in available_vars:
@@ -177,6 +301,18 @@ class DownloadData(models.DataDownloadBase):
         final_columns = ["date"] + [col for col in requested_vars if col in df.columns]
         return df[final_columns] if final_columns else pd.DataFrame()
 
+    @classmethod
+    def download_many(cls, jobs: list[dict], max_workers: int = 8) -> list[pd.DataFrame]:
+        """Run several downloads concurrently and return their DataFrames in
+        job order.
+
+        Each job is a dict of constructor kwargs (``location_coord``,
+        ``date_from_utc``, ``date_to_utc``, ``variables``, ...). Requests are
+        network-bound and share the module's pooled session, so a thread
+        pool gives near-linear speedup for multi-site / multi-window pulls.
+        """
+        return models.download_many(cls, jobs, max_workers)
+
     def download_precipitation(self):
         raise NotImplementedError
 
@@ -22,18 +22,14 @@ import logging
 from datetime import date, timedelta
 from typing import List, Optional, Tuple
 
-import ee
+import numpy as np
 import pandas as pd
-from dotenv import load_dotenv
-
-load_dotenv()
 
 from sources.utils import models
-from sources.utils.settings import Settings, set_logging
+from sources.utils.settings import Settings
 # Reuse the auth singleton from the shared GEE module so `ee.Authenticate()` runs at most once per process.
-from sources.gee import _ensure_gee_initialized
+from sources.gee import _ensure_gee_initialized, _gee_disk_cached, _gee_get_info
 
-set_logging()
 logger = logging.getLogger(__name__)
 
 AVAILABLE_MODELS = [
@@ -42,6 +38,9 @@ AVAILABLE_MODELS = [
     'INM-CM5-0', 'KACE-1-0-G', 'MIROC6', 'MPI-ESM1-2-LR',
     'MRI-ESM2-0', 'NorESM2-LM', 'NorESM2-MM', 'TaiESM1'
 ]
+# O(1) membership checks; AVAILABLE_MODELS keeps the canonical order for
+# listings and error messages.
+AVAILABLE_MODEL_SET = frozenset(AVAILABLE_MODELS)
 
 SCENARIO_MAPPING = {
     'SSP1-2.6': 'ssp126', 'SSP2-4.5': 'ssp245', 'SSP5-8.5': 'ssp585',
@@ -62,21 +61,33 @@ NEX_GDDP_CHUNK_DAYS = 4745
 NEX_GDDP_HISTORICAL_END = date(2014, 12, 31)
 NEX_GDDP_SSP_START      = date(2015, 1, 1)
 
+# Variable name -> (band, scale, offset). GEE serves SI units; the toolkit's
+# downstream convention is `band * scale + offset`:
+#   pr     kg/(m²·s) -> mm/day
+#   tasmax K         -> °C
+#   tasmin K         -> °C
+NEX_GDDP_VARIABLE_SPECS = {
+    'precipitation':   ('pr',     86400.0, 0.0),
+    'max_temperature': ('tasmax', 1.0,     -273.15),
+    'min_temperature': ('tasmin', 1.0,     -273.15),
+}
+_BAND_UNITS = {band: (scale, offset) for band, scale, offset in NEX_GDDP_VARIABLE_SPECS.values()}
+
 def _variables_to_bands(variables) -> List[str]:
-    """Map requested ClimateVariable enums (or plain strings) to NEX-GDDP band names."""
+    """Map requested ClimateVariable enums (or plain strings) to NEX-GDDP band names.
+
+    Enum members are matched on `.name` directly (already the spec keys).
+    Lookup is by name rather than enum identity because callers that set up
+    `sys.path` differently import distinct copies of `ClimateVariable`;
+    only plain strings pay for prefix stripping and lower-casing.
+    """
     bands: List[str] = []
     for v in variables:
-        name = str(v).split('.')[-1] if hasattr(v, 'name') else str(v)
-        n = name.lower()
-        if 'precipitation' in n:
-            bands.append('pr')
-        elif 'max' in n and 'temp' in n:
-            bands.append('tasmax')
-        elif 'min' in n and 'temp' in n:
-            bands.append('tasmin')
-    # De-dupe while preserving order
-    seen = set()
-    return [b for b in bands if not (b in seen or seen.add(b))]
+        spec = NEX_GDDP_VARIABLE_SPECS.get(v.name) if hasattr(v, 'name') else \
+            NEX_GDDP_VARIABLE_SPECS.get(str(v).split('.')[-1].lower())
+        if spec is not None and spec[0] not in bands:
+            bands.append(spec[0])
+    return bands
 
 class DownloadData(models.DataDownloadBase):
     def __init__(self, variables: List[models.ClimateVariable],
@@ -89,14 +100,10 @@ class DownloadData(models.DataDownloadBase):
                          date_from_utc=date_from_utc,
                          date_to_utc=date_to_utc,
                          variables=variables)
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
 
-        if model is not None and model not in AVAILABLE_MODELS:
+        if model is not None and model not in AVAILABLE_MODEL_SET:
             raise ValueError(
                 f"Invalid model '{model}'. Must be one of: {', '.join(AVAILABLE_MODELS)}"
             )
@@ -129,8 +136,10 @@ class DownloadData(models.DataDownloadBase):
         Long date ranges are split into ~13-year chunks to stay under GEE's
         5000-elements-per-collection ceiling. Chunk failures are logged and
         skipped so a single transient error doesn't kill the whole request.
+        With GEE_CACHE_DIR set, fetched chunks are cached on disk.
         """
         _ensure_gee_initialized()
+        import ee
 
         bands = _variables_to_bands(self.variables)
         if not bands:
@@ -141,40 +150,30 @@ class DownloadData(models.DataDownloadBase):
         point = ee.Geometry.Point([lon, lat])
 
         chunks: List[pd.DataFrame] = []
-        # Split the request across the historical/SSP boundary so pre-2015 years
-        # are pulled from the 'historical' run rather than coming back empty.
-        for seg_scenario, seg_start, seg_end in self._scenario_segments():
-            current = seg_start
-            while current <= seg_end:
-                chunk_end = min(
-                    current + timedelta(days=NEX_GDDP_CHUNK_DAYS - 1),
-                    seg_end,
+        for chunk_start, chunk_end in self._chunk_windows():
+            # Projections never change once published, so chunks share the
+            # GEE_CACHE_DIR disk cache with the other GEE sources.
+            key = ("nex_gddp", self.model, self.scenario, lat, lon,
+                   chunk_start.isoformat(), chunk_end.isoformat(), tuple(bands))
+            try:
+                df_chunk = _gee_disk_cached(
+                    key,
+                    lambda: self._fetch_chunk(point, chunk_start, chunk_end, bands),
+                )
+                if not df_chunk.empty:
+                    chunks.append(df_chunk)
+            except Exception as exc:
+                logger.error(
+                    f"NEX-GDDP {self.model}/{self.scenario} chunk "
+                    f"{chunk_start}->{chunk_end} failed: {exc}"
                 )
-                try:
-                    df_chunk = self._fetch_chunk(point, current, chunk_end, bands,
-                                                 seg_scenario)
-                    if not df_chunk.empty:
-                        chunks.append(df_chunk)
-                except Exception as exc:
-                    logger.error(
-                        f"NEX-GDDP {self.model}/{seg_scenario} chunk "
-                        f"{current}->{chunk_end} failed: {exc}"
-                    )
-                current = chunk_end + timedelta(days=1)
 
         if not chunks:
             return pd.DataFrame()
 
-        df = pd.concat(chunks, ignore_index=True)
-        df = df.sort_values("date").reset_index(drop=True)
-
-        # Unit normalisation: GEE returns SI units; the toolkit's downstream
-        if 'pr' in df.columns:
-            df['pr'] = df['pr'].astype(float) * 86400.0
-        for tcol in ('tasmax', 'tasmin'):
-            if tcol in df.columns:
-                df[tcol] = df[tcol].astype(float) - 273.15
-        return df
+        # Single-chunk ranges (under ~13 years) skip the concat copy.
+        df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        return df.sort_values("date").reset_index(drop=True)
 
     def _scenario_segments(self) -> List[Tuple[str, date, date]]:
         """Split [date_from, date_to] into (scenario, start, end) segments that
@@ -197,38 +196,90 @@ class DownloadData(models.DataDownloadBase):
                              self.date_to_utc))
         return segments
 
+    def _chunk_windows(self) -> List[Tuple[date, date]]:
+        """All (start, end) fetch windows for the request, built once.
+
+        Windows span the whole request, not each scenario segment: the
+        historical/SSP split is applied server-side by `_scenario_filter`, so
+        a short range crossing 2015 is still a single getInfo().
+        """
+        step = timedelta(days=NEX_GDDP_CHUNK_DAYS)
+        last = timedelta(days=NEX_GDDP_CHUNK_DAYS - 1)
+        n_windows = (self.date_to_utc - self.date_from_utc).days // NEX_GDDP_CHUNK_DAYS + 1
+        return [
+            (chunk_start, min(chunk_start + last, self.date_to_utc))
+            for chunk_start in (self.date_from_utc + i * step for i in range(n_windows))
+        ]
+
+    def _scenario_filter(self) -> "ee.Filter":
+        """One filter selecting each scenario segment's run over its own dates."""
+        import ee
+
+        filters = [
+            ee.Filter.And(
+                ee.Filter.eq("scenario", seg_scenario),
+                ee.Filter.date(
+                    seg_start.strftime("%Y-%m-%d"),
+                    (seg_end + timedelta(days=1)).strftime("%Y-%m-%d"),
+                ),
+            )
+            for seg_scenario, seg_start, seg_end in self._scenario_segments()
+        ]
+        return filters[0] if len(filters) == 1 else ee.Filter.Or(*filters)
+
     def _fetch_chunk(self, point: "ee.Geometry", from_date: date,
-                     to_date: date, bands: List[str],
-                     scenario: Optional[str] = None) -> pd.DataFrame:
-        """Fetch one date-range chunk for a given scenario; per-day DataFrame."""
-        scenario = scenario or self.scenario
+                     to_date: date, bands: List[str]) -> pd.DataFrame:
+        """Fetch one date-range chunk across its scenario segments; per-day DataFrame."""
+        import ee
+
         start = ee.Date(from_date.strftime("%Y-%m-%d"))
         end = ee.Date(to_date.strftime("%Y-%m-%d")).advance(1, "day")
 
         col = (
             ee.ImageCollection(NEX_GDDP_COLLECTION)
             .filter(ee.Filter.eq("model", self.model))
-            .filter(ee.Filter.eq("scenario", scenario))
+            .filter(self._scenario_filter())
             .filterDate(start, end)
             .filterBounds(point)
             .select(bands)
         )
-        def extract(image):
-            values = image.reduceRegion(
-                reducer=ee.Reducer.first(),
-                geometry=point,
-                scale=NEX_GDDP_SCALE_M,
-                tileScale=2,
-                bestEffort=True,
-            )
-            return ee.Feature(None, values).set(
-                "date", image.date().format("YYYY-MM-dd")
-            )
-
-        fc = col.map(extract)
-        result = fc.getInfo()
-        records = [f["properties"] for f in result.get("features", [])]
-        return pd.DataFrame(records) if records else pd.DataFrame()
+        # getRegion samples every image at the point in one request and
+        # returns a compact table ([id, lon, lat, time, *bands] rows) rather
+        # than building a Feature per day from a mapped reduceRegion.
+        rows = _gee_get_info(col.getRegion(point, NEX_GDDP_SCALE_M))
+        if len(rows) <= 1:
+            return pd.DataFrame()
+        header, data = rows[0], rows[1:]
+        # Build each column as one typed array; masked days (None) become
+        # NaN. Unit normalisation (see NEX_GDDP_VARIABLE_SPECS) is applied in
+        # place on the fresh array, so there is no second pass per band.
+        t_pos = header.index("time")
+        millis = np.array([r[t_pos] for r in data], dtype=np.int64)
+        columns = {"date": pd.to_datetime(millis, unit="ms").strftime("%Y-%m-%d")}
+        for band in bands:
+            pos = header.index(band)
+            values = np.array([r[pos] for r in data], dtype=np.float64)
+            scale, offset = _BAND_UNITS[band]
+            if scale != 1.0:
+                values *= scale
+            if offset:
+                values += offset
+            columns[band] = values
+        return pd.DataFrame(columns)
+
+    @classmethod
+    def download_many(cls, jobs: List[dict], max_workers: int = 4) -> List[pd.DataFrame]:
+        """Run several (model, scenario, point, range) downloads concurrently
+        and return their DataFrames in job order.
+
+        Each job is a dict of constructor kwargs (``variables``,
+        ``location_coord``, ``date_from_utc``, ``date_to_utc``, ``settings``,
+        ``source``, ``model``, ``scenario``). Every job is a handful of
+        independent getInfo() calls that mostly wait on the server, so a
+        small thread pool overlaps them; `_gee_get_info` keeps the combined
+        fan-out under the GEE request quota.
+        """
+        return models.download_many(cls, jobs, max_workers)
 
     def download_precipitation(self):
         raise NotImplementedError("Use download_variables()")
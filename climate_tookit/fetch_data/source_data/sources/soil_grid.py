@@ -21,14 +21,11 @@ import logging
 from datetime import date
 
 import pandas as pd
-from dotenv import load_dotenv
 
 from .utils import models
-from .utils.settings import Settings, set_logging
-from .gee import _ensure_gee_initialized
+from .utils.settings import Settings
+from .gee import _ensure_gee_initialized, _gee_get_info
 
-load_dotenv()
-set_logging()
 logger = logging.getLogger(__name__)
 
 # ISRIC SoilGrids 250m v2.0 catalogue root on Earth Engine.
@@ -69,10 +66,6 @@ class DownloadData(models.DataDownloadBase):
             date_to_utc=date_to_utc,
             variables=variables,
         )
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
 
@@ -117,13 +110,13 @@ class DownloadData(models.DataDownloadBase):
         composite = ee.Image.cat(images)
 
         try:
-            vals = composite.reduceRegion(
+            vals = _gee_get_info(composite.reduceRegion(
                 reducer=ee.Reducer.mean(),
                 geometry=region,
                 scale=scale,
                 bestEffort=True,
                 maxPixels=int(1e9),
-            ).getInfo() or {}
+            )) or {}
         except Exception as e:
             logger.error(f"soil_grid: GEE reduceRegion failed: {e}")
             return pd.DataFrame()
@@ -15,15 +15,35 @@ import os
 import tempfile
 import numpy as np
 import pandas as pd
-import xarray as xr
 import requests
-from datetime import date, timedelta
+from datetime import date
 from typing import Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sources.utils.models import DataDownloadBase, ClimateVariable
 from sources.utils.settings import Settings
 
 logger = logging.getLogger(__name__)
 
+# One pooled session per process, set up on import rather than per call:
+# every download_* call and every DownloadTAMSAT instance (e.g. one per year
+# in a baseline loop) reuses the open connection to the JASMIN server.
+# Transient 429/5xx responses are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
 class DownloadTAMSAT(DataDownloadBase):
     def __init__(
         self,
@@ -37,17 +57,10 @@ class DownloadTAMSAT(DataDownloadBase):
     ):
         super().__init__(variables=variables or [], location_coord=location_coord,
                          date_from_utc=date_from_utc, date_to_utc=date_to_utc)
-        self.location_coord = location_coord
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.variables = variables or []
         self.settings = settings or Settings.load()
         self.source = source
         self.aggregation = aggregation
-        self.dates = [
-            date_from_utc + timedelta(days=i)
-            for i in range((date_to_utc - date_from_utc).days + 1)
-        ]
+        self.dates = list(pd.date_range(date_from_utc, date_to_utc, freq="D").date)
 
     _NETCDF_ENGINES = ("h5netcdf", "netcdf4", "scipy")
 
@@ -58,6 +71,11 @@ class DownloadTAMSAT(DataDownloadBase):
         `_read_nc_variable`). Returns (Dataset, tmp_path) or (None, None).
         We write to disk rather than passing BytesIO because some xarray backends leave lazy references that break when the BytesIO closes.
         """
+        # xarray (and its netCDF backends) is only needed once a TAMSAT file
+        # is actually being read; importing it here keeps it off the import
+        # path of every CLI that merely loads `source_data`.
+        import xarray as xr
+
         fd, tmp_path = tempfile.mkstemp(suffix=".nc", prefix="tamsat_")
         try:
             os.close(fd)
@@ -113,57 +131,51 @@ class DownloadTAMSAT(DataDownloadBase):
         lat0, lon0 = self.location_coord
         values_by_date: dict = {}
 
-        session = requests.Session()
-        session.headers.update({"User-Agent": "Mozilla/5.0"})
-
-        try:
-            for dt in self.dates:
-                file_name = (
-                    f"{file_prefix}{dt.year}_{dt.month:02d}_{dt.day:02d}"
-                    f".{version}.nc"
-                )
-                url = (
-                    f"{base_url.rstrip('/')}/{dt.year}/{dt.month:02d}/{file_name}"
-                )
+        for dt in self.dates:
+            file_name = (
+                f"{file_prefix}{dt.year}_{dt.month:02d}_{dt.day:02d}"
+                f".{version}.nc"
+            )
+            url = (
+                f"{base_url.rstrip('/')}/{dt.year}/{dt.month:02d}/{file_name}"
+            )
+            try:
+                resp = _SESSION.get(url, timeout=30)
+                resp.raise_for_status()
+                ds, tmp_path = self._open_netcdf_bytes(resp.content)
+                if ds is None:
+                    raise RuntimeError(
+                        "no working xarray engine could read the TAMSAT file"
+                    )
                 try:
-                    resp = session.get(url, timeout=30)
-                    resp.raise_for_status()
-                    ds, tmp_path = self._open_netcdf_bytes(resp.content)
-                    if ds is None:
-                        raise RuntimeError(
-                            "no working xarray engine could read the TAMSAT file"
-                        )
-                    try:
-                        da = ds[expected_var]
-
-                        # Spatial selection: nearest gridcell to (lat0, lon0).
-                        sel_kwargs = {}
-                        if "lat" in da.dims:
-                            sel_kwargs["lat"] = lat0
-                        if "lon" in da.dims:
-                            sel_kwargs["lon"] = lon0
-                        if sel_kwargs:
-                            da = da.sel(method="nearest", **sel_kwargs)
-
-                        # Each daily file has time-dim 1; just read the scalar.
-                        arr = np.asarray(da.values, dtype=float).ravel()
-                        values_by_date[dt] = (
-                            float(arr[0]) if arr.size else np.nan
-                        )
-                    finally:
-                        ds.close()
-                        try:
-                            if tmp_path:
-                                os.unlink(tmp_path)
-                        except OSError:
-                            pass
-                except Exception as e:
-                    logger.warning(
-                        f"TAMSAT fetch failed for {dt.isoformat()} ({url}): {e}"
+                    da = ds[expected_var]
+
+                    # Spatial selection: nearest gridcell to (lat0, lon0).
+                    sel_kwargs = {}
+                    if "lat" in da.dims:
+                        sel_kwargs["lat"] = lat0
+                    if "lon" in da.dims:
+                        sel_kwargs["lon"] = lon0
+                    if sel_kwargs:
+                        da = da.sel(method="nearest", **sel_kwargs)
+
+                    # Each daily file has time-dim 1; just read the scalar.
+                    arr = np.asarray(da.values, dtype=float).ravel()
+                    values_by_date[dt] = (
+                        float(arr[0]) if arr.size else np.nan
                     )
-                    values_by_date[dt] = np.nan
-        finally:
-            session.close()
+                finally:
+                    ds.close()
+                    try:
+                        if tmp_path:
+                            os.unlink(tmp_path)
+                    except OSError:
+                        pass
+            except Exception as e:
+                logger.warning(
+                    f"TAMSAT fetch failed for {dt.isoformat()} ({url}): {e}"
+                )
+                values_by_date[dt] = np.nan
 
         return [values_by_date.get(dt, np.nan) for dt in self.dates]
 
@@ -4,13 +4,31 @@ import logging
 from datetime import date
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .utils import models
-from .utils.settings import Settings, set_logging
+from .utils.settings import Settings
 
-set_logging()
 logger = logging.getLogger(__name__)
 
+# One pooled session per process: the per-year NetCDF downloads reuse the
+# open TLS connection to the TerraClimate server instead of handshaking for
+# every file. Transient 429/5xx responses are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        ),
+    ),
+)
+
 
 class DownloadData(models.DataDownloadBase):
     def __init__(
@@ -29,10 +47,6 @@ class DownloadData(models.DataDownloadBase):
             variables=variables,
         )
 
-        self.date_from_utc = date_from_utc
-        self.date_to_utc = date_to_utc
-        self.location_coord = location_coord
-        self.variables = variables
         self.settings = settings
         self.source = source
 
@@ -45,7 +59,7 @@ class DownloadData(models.DataDownloadBase):
 
         try:
             logger.info(f"Downloading file from: {url}")
-            response = requests.get(url, stream=True)
+            response = _SESSION.get(url, stream=True)
             response.raise_for_status()
 
             with open(filename, "wb") as f:
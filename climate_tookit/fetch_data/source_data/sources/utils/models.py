@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
 from enum import Enum, auto
-from typing import NamedTuple
+from typing import Iterable, NamedTuple
 
 import pandas as pd
 
@@ -78,7 +78,10 @@ class DataDownloadBase(ABC):
         date_from_utc: date,
         date_to_utc: date,
     ):
-        pass
+        self.variables = variables
+        self.location_coord = location_coord
+        self.date_from_utc = date_from_utc
+        self.date_to_utc = date_to_utc
 
     @abstractmethod
     def download_rainfall():
@@ -120,4 +123,20 @@ class DataDownloadBase(ABC):
     @abstractmethod
     def download_variables() -> pd.DataFrame:
         """Retrieves all variables available in the climate database"""
-        pass
\ No newline at end of file
+        pass
+
+
+def download_many(cls, jobs: Iterable[dict], max_workers: int) -> list[pd.DataFrame]:
+    """Run several downloads of a DataDownloadBase subclass concurrently and
+    return their DataFrames in job order.
+
+    Each job is a dict of `cls` constructor kwargs; every job calls
+    `cls(**job).download_variables()` on a small thread pool.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    from concurrent.futures import ThreadPoolExecutor
+    workers = max(1, min(max_workers, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(lambda kw: cls(**kw).download_variables(), jobs))
@@ -1,22 +1,42 @@
 """This module contains settings and paths for the `source_data` module"""
 
+import functools
 import logging
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, field_validator
 
+# libyaml's C loader parses several times faster; fall back to the pure
+# Python loader when PyYAML was built without it.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 BASE_DIR = Path(__file__).parent.parent.parent
 config_path = Path(__file__).parent / "config.yaml"
 
 def set_logging():
-    """Configure logging for the application"""
+    """Configure logging for the application.
+
+    Called by the CLI entry points, not at import time, so importing the
+    toolkit as a library leaves the caller's logging configuration alone.
+    """
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(filename)s:%(lineno)d --- %(message)s",
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_env() -> None:
+    """Load the project .env (GCP_PROJECT_ID, GEE_CACHE_DIR,
+    NASA_POWER_CACHE_DIR) once."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
 class Cadence(BaseModel):
     monthly: str
     daily: str
@@ -171,10 +191,21 @@ class Settings(BaseModel):
 
     @classmethod
     def load(cls, settings_path: Path = config_path):
-        with open(settings_path, mode="r") as f:
-            settings = yaml.safe_load(f)
+        """Parse and validate `settings_path`.
+
+        The result is cached per resolved path, so every module and CLI call
+        that loads the default config shares one instance; treat it as
+        read-only.
+        """
+        return _load_settings(str(Path(settings_path).resolve()))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_settings(settings_path: str) -> Settings:
+    with open(settings_path, mode="r") as f:
+        settings = yaml.load(f, Loader=YamlLoader)
 
-        return cls(**settings)
+    return Settings(**settings)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,15 @@
 import sys
 import os
 from datetime import date
+from functools import lru_cache
 import yaml
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "source_data"))
 
 from source_data import SourceData, resolve_models, _suffix_path
 from sources.utils.models import ClimateVariable, ClimateDataset, SoilVariable
-from sources.utils.settings import Settings
+from sources.nex_gddp import AVAILABLE_MODELS, AVAILABLE_MODEL_SET
+from sources.utils.settings import Settings, YamlLoader, set_logging
 
 def validate_coordinates(lat, lon):
     """Validate latitude and longitude ranges."""
@@ -33,12 +35,10 @@ def validate_inputs(source, lat, lon, date_from, date_to, model, scenario):
     if date_from and date_to and date_from > date_to:
         errors.append("Start date must be before end date")
     if source == "nex_gddp":
-        valid_models = ['ACCESS-CM2','ACCESS-ESM1-5','CanESM5','CMCC-ESM2','EC-Earth3','EC-Earth3-Veg-LR','GFDL-ESM4','INM-CM4-8',
-                        'INM-CM5-0','KACE-1-0-G','MIROC6','MPI-ESM1-2-LR','MRI-ESM2-0','NorESM2-LM','NorESM2-MM','TaiESM1']
         valid_scenarios = ["ssp126", "ssp245", "ssp585"]
-        if model and model not in valid_models:
+        if model and model not in AVAILABLE_MODEL_SET:
             errors.append(
-                f"Invalid model '{model}'. Valid models: {', '.join(valid_models)}"
+                f"Invalid model '{model}'. Valid models: {', '.join(AVAILABLE_MODELS)}"
             )
         if scenario and scenario not in valid_scenarios:
             errors.append(
@@ -49,14 +49,33 @@ def validate_inputs(source, lat, lon, date_from, date_to, model, scenario):
 
 def load_yaml(path: str):
     with open(path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
+@lru_cache(maxsize=1)
 def load_variable_mappings():
+    """Source -> {raw column: toolkit name} mappings from data_dictionary.yaml.
+
+    Parsed once per process; the returned dict is shared, so don't mutate it.
+    """
     yaml_path = os.path.join(os.path.dirname(__file__), "data_dictionary.yaml")
     return load_yaml(yaml_path)["source_mappings"]
 
 
+@lru_cache(maxsize=None)
+def _resolve_source(source: str):
+    """Return (ClimateDataset member, column mapping) for `source`, once per source."""
+    try:
+        dataset = ClimateDataset[source]
+    except KeyError:
+        raise ValueError(f"Unknown source '{source}'")
+
+    mappings = load_variable_mappings().get(source, {})
+    if not mappings:
+        raise ValueError(f"No variable mappings found for source '{source}'")
+    return dataset, mappings
+
+
 def load_scaling_config(source: str, settings: Settings):
     data_settings = getattr(settings, source, None)
     if data_settings is None:
@@ -127,10 +146,9 @@ def transform_data(
     date_from = date_from or date.today()
     date_to = date_to or date.today()
 
-    try:
-        dataset = ClimateDataset[source]
-    except KeyError:
-        raise ValueError(f"Unknown source '{source}'")
+    # Resolved before downloading so a source without mappings fails fast
+    # rather than after a full fetch.
+    dataset, mappings = _resolve_source(source)
 
     src = SourceData(
         location_coord=location_coord,
@@ -145,11 +163,11 @@ def transform_data(
 
     raw_df = src.download()
 
-    mappings = load_variable_mappings().get(source, {})
-    if not mappings:
-        raise ValueError(f"No variable mappings found for source '{source}'")
-
-    return raw_df.rename(columns=mappings)
+    # Only the labels change, so don't let rename copy the column blocks;
+    # and skip it entirely when none of the raw columns are mapped.
+    if mappings.keys().isdisjoint(raw_df.columns):
+        return raw_df
+    return raw_df.rename(columns=mappings, copy=False)
 
 
 def save_output(data, output_path, fmt):
@@ -164,6 +182,8 @@ def save_output(data, output_path, fmt):
 if __name__ == "__main__":
     import argparse
 
+    set_logging()
+
     parser = argparse.ArgumentParser()
     parser.add_argument("--source", required=True)
     parser.add_argument("--lon", type=float)
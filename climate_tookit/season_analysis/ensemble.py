@@ -23,6 +23,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import season_analysis.seasons as seasons
 from fetch_data.preprocess_data.preprocess_data import preprocess_data
+from sources.utils.settings import set_logging
 
 NEX_GDDP_MODELS = [
     'ACCESS-CM2',  'ACCESS-ESM1-5',    'CanESM5',       'CMCC-ESM2',
@@ -66,15 +67,18 @@ def use_nex_gddp(model: str, scenario: str):
             df = preprocess_data(
                 source         = NEX_GDDP_SOURCE,
                 location_coord = (lat, lon),
-                date_from      = date.fromisoformat(start_date),
-                date_to        = date.fromisoformat(end_date),
+                date_from      = (start_date if isinstance(start_date, date)
+                                  else date.fromisoformat(start_date)),
+                date_to        = (end_date if isinstance(end_date, date)
+                                  else date.fromisoformat(end_date)),
                 model          = model,
                 scenario       = scenario,
             )
             if df is None or df.empty:
                 raise RuntimeError("preprocess_data returned empty DataFrame")
             out = pd.DataFrame({
-                'date':   pd.to_datetime(df['date']),
+                'date':   (df['date'] if pd.api.types.is_datetime64_any_dtype(df['date'])
+                           else pd.to_datetime(df['date'], cache=True)),
                 'tmax':   df.get('max_temperature'),
                 'tmin':   df.get('min_temperature'),
                 'precip': df.get('precipitation'),
@@ -649,6 +653,7 @@ def main():
     p.add_argument('--output',       help='Save JSON result here')
     p.add_argument('--quiet',        action='store_true')
     args = p.parse_args()
+    set_logging()
 
     if args.source_key:
         NEX_GDDP_SOURCE = args.source_key
@@ -0,0 +1,16 @@
+"""Optional numba support shared by the analysis modules.
+
+`njit` compiles the sequential day-by-day loops when numba is installed;
+without it the decorator is a no-op and the same functions run as plain
+Python. `NUMBA_AVAILABLE` lets callers pick inputs suited to each path.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
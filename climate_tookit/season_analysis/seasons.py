@@ -7,8 +7,9 @@ based on whether precipitation meets or exceeds 50% of reference evapotranspirat
 Data source priority:
     Historical : ERA5 -> AgERA5 -> CHIRPS + CHIRTS (fallback)
 Detection strategy:
-    Per reference year: fetches a 1.5-year window (Jan-Dec + 6 extra months)
-    to capture seasons that cross the year boundary.
+    Per reference year: a 1.5-year window (Jan-Dec + 6 extra months), sliced
+    from one fetch of the whole period, to capture seasons that cross the
+    year boundary.
     Post-processing: reassigns seasons to their onset year, filters to
     MAM/OND onset windows for equatorial climates, removes duplicates.
 Perhumid guard (used internally during ETO detection):
@@ -44,17 +45,29 @@ import math
 import argparse
 import sys
 import warnings
+from functools import lru_cache
 from datetime import datetime, date, timedelta
-from typing import Tuple, Dict, List, Any, Optional
+from typing import Tuple, Dict, List, Any, Optional, Union
 from pathlib import Path
 
 warnings.filterwarnings("ignore")
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 from fetch_data.preprocess_data.preprocess_data import preprocess_data
+from sources.utils.settings import set_logging
+from season_analysis.numba_compat import njit, NUMBA_AVAILABLE
 
 HISTORICAL_SOURCES = ['era_5', 'agera_5']
 FALLBACK_COMBO     = ('chirps', 'chirts')
+# preprocess_data column names -> the short names used throughout this module
+CLIMATE_COLUMNS    = {
+    'max_temperature': 'tmax',
+    'min_temperature': 'tmin',
+    'precipitation':   'precip',
+}
+CLIMATE_DTYPES     = {col: np.float32 for col in CLIMATE_COLUMNS.values()}
+# Concurrent window fetches in fetch_and_analyze_years (network-bound)
+FETCH_WORKERS      = 8
 
 # Internal perhumid guard thresholds (detection)
 PERHUMID_ANNUAL_MM      = 1400
@@ -81,9 +94,7 @@ def check_humid(annual_rain_mm: float, year_df: pd.DataFrame) -> Dict[str, Any]:
     -------
     dict:  is_humid, low_rain_months, result_str
     """
-    df_m = year_df.copy()
-    df_m['month'] = df_m['date'].dt.month
-    monthly_totals  = df_m.groupby('month')['precip'].apply(lambda x: x.fillna(0).sum())
+    monthly_totals  = year_df['precip'].groupby(year_df['date'].dt.month).sum()
     low_rain_months = int((monthly_totals < HUMID_LOW_MONTH_MM).sum())
     is_humid        = (annual_rain_mm > HUMID_ANNUAL_MM_THRESHOLD) and (low_rain_months <= HUMID_MAX_LOW_RAIN_MONTHS)
 
@@ -144,23 +155,21 @@ def compute_season_stats(df: pd.DataFrame, onset, cessation) -> Dict[str, Any]:
     """
     onset_ts  = pd.Timestamp(onset)
     cess_ts   = pd.Timestamp(cessation)
-    season_df = df[(df['date'] >= onset_ts) & (df['date'] <= cess_ts)].copy()
+    season_df = df[(df['date'] >= onset_ts) & (df['date'] <= cess_ts)]
+    return season_stats_from_precip(season_df['precip'].fillna(0).to_numpy())
 
-    if season_df.empty:
+def season_stats_from_precip(precip: np.ndarray) -> Dict[str, Any]:
+    """compute_season_stats on a season's daily precip array (NaN already filled)."""
+    if precip.size == 0:
         return dict(total_rainfall_mm=0.0, rainy_days=0, dry_days=0, dry_spells=0)
-    precip         = season_df['precip'].fillna(0).to_numpy()
     total_rainfall = float(np.sum(precip))
     rainy_days     = int(np.sum(precip >= 1.0))
     dry_days       = int(np.sum(precip <  1.0))
-    dry_spells  = 0
-    consecutive = 0
-    for p in precip:
-        if p < 1.0:
-            consecutive += 1
-            if consecutive == 7:
-                dry_spells += 1
-        else:
-            consecutive = 0
+    # Length of the dry run ending at each day = index - index of the last
+    # rainy day (running max); each spell crosses length 7 exactly once.
+    idx        = np.arange(precip.size)
+    last_rainy = np.maximum.accumulate(np.where(precip < 1.0, -1, idx))
+    dry_spells = int(np.count_nonzero(idx - last_rainy == 7))
     return dict(
         total_rainfall_mm = round(total_rainfall, 1),
         rainy_days        = rainy_days,
@@ -200,26 +209,37 @@ def run_eto_in_window(df_with_et0: pd.DataFrame, onset, cessation) -> List[Dict]
 def get_climate_data(
     lat         : float,
     lon         : float,
-    start_date  : str,
-    end_date    : str,
+    start_date  : Union[str, date],
+    end_date    : Union[str, date],
     force_source: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Fetch standardised daily climate data (date, tmax, tmin, precip).
+    Dates may be ISO strings or date objects.
     Source priority: era_5 → agera_5 → chirps+chirts.
     Raises RuntimeError when all sources are exhausted.
+    Results are memoised per process on the call arguments; every caller
+    gets its own copy. Failed fetches are not cached.
     """
-    date_from = date.fromisoformat(start_date)
-    date_to   = date.fromisoformat(end_date)
+    date_from = start_date if isinstance(start_date, date) else date.fromisoformat(start_date)
+    date_to   = end_date   if isinstance(end_date, date)   else date.fromisoformat(end_date)
+    return _climate_data_cached(lat, lon, date_from, date_to, force_source).copy()
+
+@lru_cache(maxsize=32)
+def _climate_data_cached(lat, lon, date_from, date_to, force_source) -> pd.DataFrame:
     df = _fetch_raw(lat, lon, date_from, date_to, force_source)
     if df is None or df.empty:
         raise RuntimeError("All data sources exhausted.")
-    result           = pd.DataFrame()
-    result['date']   = pd.to_datetime(df['date'])
-    result['tmax']   = df.get('max_temperature')
-    result['tmin']   = df.get('min_temperature')
-    result['precip'] = df.get('precipitation')
-    return result
+    # One rename + select builds the frame in a single step instead of copying
+    # the columns into it one by one; a missing variable comes back as an
+    # all-NaN column.
+    result = (df.rename(columns=CLIMATE_COLUMNS)
+                .reindex(columns=['date', 'tmax', 'tmin', 'precip']))
+    if not pd.api.types.is_datetime64_any_dtype(result['date']):
+        result['date'] = pd.to_datetime(result['date'], cache=True)
+    # float32 holds every physically meaningful digit of these series and
+    # halves the memory the ET0 and rainy-day passes stream through.
+    return result.astype(CLIMATE_DTYPES, copy=False)
 
 def _fetch_raw(lat, lon, date_from, date_to, force_source) -> Optional[pd.DataFrame]:
     coord = (lat, lon)
@@ -243,7 +263,15 @@ def _merge_chirps_chirts(coord, date_from, date_to) -> pd.DataFrame:
                            date_from=date_from, date_to=date_to)
     df_t = preprocess_data(source=FALLBACK_COMBO[1], location_coord=coord,
                            date_from=date_from, date_to=date_to)
-    return pd.merge(df_p, df_t, on='date', how='inner')
+    # Both are daily series over the same window: when the date columns line
+    # up, attach the temperature columns positionally; otherwise align on a
+    # date index rather than going through the hash-merge engine.
+    if len(df_p) == len(df_t) and df_p['date'].equals(df_t['date']):
+        return pd.concat([df_p.reset_index(drop=True),
+                          df_t.drop(columns='date').reset_index(drop=True)], axis=1)
+    return (df_p.set_index('date')
+                .join(df_t.set_index('date'), how='inner')
+                .reset_index())
 
 # ET0 — Hargreaves
 def deg2rad(deg):        return deg * math.pi / 180.0
@@ -251,6 +279,19 @@ def day_of_year(d):      return d.timetuple().tm_yday
 def sol_dec(J):          return 0.409 * math.sin((2 * math.pi / 365) * J - 1.39)
 def inv_rel_dist(J):     return 1 + 0.033 * math.cos((2 * math.pi / 365) * J)
 
+_SIN_139, _COS_139 = math.sin(1.39), math.cos(1.39)
+
+def solar_terms(J):
+    """(sol_dec(J), inv_rel_dist(J)) from a single sin/cos pair.
+
+    Both terms are functions of the same angle w = 2*pi*J/365, so
+    sin(w - 1.39) is expanded by angle addition rather than evaluated as
+    a separate transcendental. Accepts a scalar or an array of days.
+    """
+    w    = (2 * np.pi / 365) * J
+    s, c = np.sin(w), np.cos(w)
+    return 0.409 * (s * _COS_139 - c * _SIN_139), 1 + 0.033 * c
+
 def sunset_hour_angle(lat, sol_decl):
     val = -math.tan(lat) * math.tan(sol_decl)
     return math.acos(max(min(val, 1), -1))
@@ -268,19 +309,63 @@ def hargreaves(tmin, tmax, Ra):
     Tmean = (tmax + tmin) / 2
     return 0.0023 * math.sqrt(tmax - tmin) * (Tmean + 17.8) * Ra
 
+@lru_cache(maxsize=64)
+def solar_ra_table(lat: float) -> np.ndarray:
+    """Extraterrestrial radiation Ra for day-of-year 1..366 at `lat` (index J - 1).
+
+    Ra depends only on latitude and day of year, so a multi-year frame at
+    one site reuses these 366 values instead of redoing the solar geometry
+    per row. Callers round `lat` so float noise does not defeat the cache.
+    """
+    lat_rad   = deg2rad(lat)
+    decl, ird = solar_terms(np.arange(1, 367, dtype=np.float64))
+    sha = np.arccos(np.clip(-math.tan(lat_rad) * np.tan(decl), -1, 1))
+    Ra  = ((24 * 60) / math.pi) * 0.0820 * ird * (
+        sha * math.sin(lat_rad) * np.sin(decl) +
+        math.cos(lat_rad) * np.cos(decl) * np.sin(sha)
+    )
+    Ra.flags.writeable = False
+    return Ra
+
+def et0_hargreaves(tmin, tmax, doy, lat: float) -> np.ndarray:
+    """Hargreaves ET0 (mm/day) for aligned tmin / tmax / day-of-year arrays.
+
+    Vectorised form of sol_dec / sunset_hour_angle / et_rad / hargreaves,
+    with Ra looked up from the per-latitude solar_ra_table. Days
+    hargreaves() would reject (missing temperature, tmax < tmin) are NaN.
+    """
+    Ra   = solar_ra_table(round(float(lat), 4))[np.asarray(doy) - 1]
+    tmax = np.asarray(pd.to_numeric(tmax, errors='coerce'), dtype=np.float64)
+    tmin = np.asarray(pd.to_numeric(tmin, errors='coerce'), dtype=np.float64)
+    if NUMBA_AVAILABLE:
+        return _hargreaves_fused(tmin, tmax, Ra)
+    # Whole-array arithmetic: NaN temperatures propagate on their own, and
+    # tmax < tmin is turned into NaN up front, so no masked gathers are needed.
+    trange = tmax - tmin
+    trange[trange < 0] = np.nan
+    return 0.0023 * np.sqrt(trange) * ((tmax + tmin) / 2 + 17.8) * Ra
+
+@njit(cache=True)
+def _hargreaves_fused(tmin, tmax, Ra):
+    """One compiled pass over the days, with no temporary arrays (numba only)."""
+    out = np.empty(tmin.shape[0])
+    for k in range(tmin.shape[0]):
+        if tmax[k] >= tmin[k]:  # False when either is NaN
+            out[k] = (0.0023 * math.sqrt(tmax[k] - tmin[k])
+                      * ((tmax[k] + tmin[k]) / 2 + 17.8) * Ra[k])
+        else:
+            out[k] = np.nan
+    return out
+
 def add_et0(df: pd.DataFrame, lat: float) -> pd.DataFrame:
     """Compute Hargreaves ET0 and add column ET0_mm_day."""
-    lat_rad   = deg2rad(lat)
-    et_values = []
-    for _, row in df.iterrows():
-        J        = day_of_year(row['date'].to_pydatetime())
-        decl     = sol_dec(J)
-        ird      = inv_rel_dist(J)
-        sha      = sunset_hour_angle(lat_rad, decl)
-        Ra       = et_rad(lat_rad, decl, sha, ird)
-        et_values.append(hargreaves(row['tmin'], row['tmax'], Ra))
+    et_values = et0_hargreaves(df['tmin'], df['tmax'],
+                               df['date'].dt.dayofyear.to_numpy(), lat)
     df = df.copy()
-    df['ET0_mm_day'] = et_values
+    # Computed in float64, stored as float32 like the inputs, so the frame
+    # stays one float32 block and the rainy-day test (precip >= 0.5 * ET0)
+    # compares float32 arrays without upcasting precip.
+    df['ET0_mm_day'] = et_values.astype(np.float32)
     return df
 
 # Perhumid guard (internal — used by detect_onset_cessation)
@@ -291,10 +376,9 @@ def is_perhumid_location(annual_rain, df, threshold_rain=1400,
         reference_year = df['date'].dt.year.mode()[0]
     ref_year_df   = df[df['date'].dt.year == reference_year]
     rainy_days_yr = int(np.sum(ref_year_df['precip'].fillna(0) >= 1.0))
-    df_monthly    = df.copy()
-    df_monthly['year']  = df_monthly['date'].dt.year
-    df_monthly['month'] = df_monthly['date'].dt.month
-    monthly_precip      = df_monthly.groupby(['year', 'month'])['precip'].sum()
+    monthly_precip      = df['precip'].groupby(
+        [df['date'].dt.year.rename('year'), df['date'].dt.month.rename('month')]
+    ).sum()
     ref_year_months     = monthly_precip[reference_year]
     num_low_rain_months = int(np.sum(ref_year_months < threshold_low_rain_months))
     is_perhumid = (
@@ -306,10 +390,10 @@ def is_perhumid_location(annual_rain, df, threshold_rain=1400,
 
 # Regime detection
 def detect_regime(df):
-    df = df.copy()
-    df['year']  = df['date'].dt.year
-    df['month'] = df['date'].dt.month
-    monthly = df.groupby(['year', 'month'])['precip'].sum().reset_index()
+    # Group by derived key Series rather than copying df to add columns.
+    years   = df['date'].dt.year.rename('year')
+    months  = df['date'].dt.month.rename('month')
+    monthly = df['precip'].groupby([years, months]).sum().reset_index()
     annual_totals           = monthly.groupby('year')['precip'].sum()
     monthly['annual_total'] = monthly['year'].map(annual_totals)
     monthly['is_peak'] = (
@@ -320,7 +404,7 @@ def detect_regime(df):
     yearly_peaks = monthly.groupby('year')['is_peak'].sum()
     peak_months  = monthly[monthly['is_peak']].groupby('year')['month'].apply(list)
     regime_dict  = {}
-    for year in df['year'].unique():
+    for year in years.unique():
         if year not in yearly_peaks.index:
             regime_dict[year] = 'unimodal'; continue
         n_peaks = yearly_peaks[year]
@@ -331,38 +415,65 @@ def detect_regime(df):
             regime_dict[year] = 'year_crossing' if pm > 6 else 'unimodal'
         else:
             regime_dict[year] = 'erratic'
-    return df['year'].map(regime_dict)
+    return years.map(regime_dict)
 
 # Wet-spell confirmation
 def has_wet_confirmation(precip_data, et0_data, start_idx, min_wet_days=3, annual_rain=800):
     if start_idx + 25 > len(precip_data):
         return False
-    threshold     = 0.5 * et0_data[start_idx: start_idx + 25]
-    precip_window = precip_data[start_idx: start_idx + 25]
-    wet_streak    = 0
-    for i, (p, t) in enumerate(zip(precip_window, threshold)):
-        if p >= t:
+    # One vectorised comparison, then the sequential streak scan. With numba
+    # the scan is compiled and reads the bool array directly; without it, a
+    # list of plain bools is cheaper to index than NumPy scalars.
+    wet = (precip_data[start_idx: start_idx + 25]
+           >= 0.5 * et0_data[start_idx: start_idx + 25])
+    max_dry_allowed = 3 if annual_rain < 600 else 2
+    return _wet_streak_confirmed(wet if NUMBA_AVAILABLE else wet.tolist(),
+                                 min_wet_days, max_dry_allowed)
+
+@njit(cache=True)
+def _wet_streak_confirmed(wet, min_wet_days, max_dry_allowed):
+    """True once min_wet_days wet days run in a row, tolerating a dry day
+    only when another wet day follows within max_dry_allowed days."""
+    n          = len(wet)
+    wet_streak = 0
+    for i in range(n):
+        if wet[i]:
             wet_streak += 1
             if wet_streak >= min_wet_days:
                 return True
         else:
             wet_streak = 0
-            max_dry_allowed = 3 if annual_rain < 600 else 2
-            if i + max_dry_allowed <= len(precip_window):
-                if sum(precip_window[i:i + max_dry_allowed] >= threshold[i:i + max_dry_allowed]) >= 1:
-                    continue
-            break
+            if i + max_dry_allowed > n:
+                return False
+            recovers = False
+            for j in range(i, i + max_dry_allowed):
+                if wet[j]:
+                    recovers = True
+                    break
+            if not recovers:
+                return False
     return False
 
 # Onset/cessation detection
+def dry_runs(rainy_flags):
+    """Run-length encode the dry days: (start index, length) of each dry run."""
+    dry   = np.concatenate(([False], ~rainy_flags, [False]))
+    edges = np.flatnonzero(dry[1:] != dry[:-1])
+    starts, ends = edges[::2], edges[1::2]
+    return starts, ends - starts
+
+
 def detect_onset_cessation(df):
     """Fully adaptive onset/cessation detection. Returns list of season dicts."""
     precip = df['precip'].fillna(0).to_numpy()
     et0    = df['ET0_mm_day'].fillna(0).to_numpy()
     dates  = df['date'].to_numpy()
+    # Integer day numbers for date arithmetic in the scan below, instead of
+    # round-tripping numpy datetimes through pd.to_datetime.
+    day_no = dates.astype('datetime64[D]').astype(np.int64)
     main_year   = df['date'].dt.year.mode()[0]
     year_df     = df[df['date'].dt.year == main_year]
-    annual_rain = year_df['precip'].sum()
+    annual_rain = float(year_df['precip'].astype(np.float64).sum())
 
     is_perhumid, num_low_rain_months, rainy_days, monthly_precip = \
         is_perhumid_location(annual_rain, df, reference_year=main_year)
@@ -398,6 +509,8 @@ def detect_onset_cessation(df):
     regime_array  = regime_series.fillna('unimodal').to_numpy()
     threshold     = 0.5 * et0
     rainy_flags   = precip >= threshold
+    run_starts, run_lengths = dry_runs(rainy_flags)
+    rainy_idx     = np.flatnonzero(rainy_flags)
 
     results = []
     i, n    = 0, len(df)
@@ -410,27 +523,24 @@ def detect_onset_cessation(df):
             onset_date     = dates[i]
             onset_regime   = regime_array[i]
             cess_threshold = int(base_cess_days * regime_multipliers.get(onset_regime, 1.0))
-            dry_counter    = 0
-            j              = i + 1
             cessation_date = None
+            cess_idx       = None
 
-            while j < n:
-                if not rainy_flags[j]:
-                    dry_counter += 1
-                    if dry_counter >= cess_threshold:
-                        cessation_date = dates[j - cess_threshold]
-                        break
-                else:
-                    dry_counter = 0
-                j += 1
+            # The season ends on the last day before the first dry run of
+            # at least cess_threshold days after onset.
+            k    = np.searchsorted(run_starts, i + 1)
+            long = np.flatnonzero(run_lengths[k:] >= cess_threshold)
+            if long.size:
+                cess_idx       = int(run_starts[k + long[0]]) - 1
+                cessation_date = dates[cess_idx]
 
-            end_for_duration = cessation_date if cessation_date else dates[-1]
-            rainy_duration   = (
-                pd.to_datetime(end_for_duration) - pd.to_datetime(onset_date)
-            ).days + 1
+            end_idx          = cess_idx if cess_idx is not None else n - 1
+            rainy_duration   = int(day_no[end_idx] - day_no[i]) + 1
 
             if rainy_duration >= min_rainy_days:
-                stats = compute_season_stats(df, onset_date, end_for_duration)
+                # The season is rows i..end_idx of the (date-sorted) frame,
+                # so slice the precip array instead of re-filtering df by date.
+                stats = season_stats_from_precip(precip[i:end_idx + 1])
                 results.append({
                     'onset':          onset_date,
                     'cessation':      cessation_date,
@@ -444,19 +554,18 @@ def detect_onset_cessation(df):
                     ),
                     **stats,
                 })
-            if cessation_date:
-                try:
-                    idx_after = next(
-                        k for k, d in enumerate(dates)
-                        if pd.to_datetime(d) == pd.to_datetime(cessation_date)
-                    )
-                    i = idx_after + cess_threshold + 1
-                except StopIteration:
-                    break
+            if cess_idx is not None:
+                # Resume from the first day carrying the cessation date; the
+                # frame is date-sorted, so that is a binary search.
+                idx_after = int(np.searchsorted(day_no, day_no[cess_idx]))
+                i = idx_after + cess_threshold + 1
             else:
                 break
         else:
-            i += 1
+            # Jump straight to the next rainy day instead of stepping
+            # through the dry ones.
+            k = np.searchsorted(rainy_idx, i)
+            i = int(rainy_idx[k]) if k < rainy_idx.size else n
     return results
 
 # Reassignment & deduplication
@@ -468,37 +577,41 @@ def reassign_spillover_seasons(results_dict, lat=0, start_year=None,
     if start_year is None: start_year = min(results_dict.keys()) if results_dict else None
     if end_year   is None: end_year   = max(results_dict.keys()) if results_dict else None
     if start_year is None or end_year is None: return {}
-    cleaned = {year: [] for year in range(start_year, end_year + 1)}
+    # Each onset is parsed once and kept alongside its season for the sort.
+    kept = {year: [] for year in range(start_year, end_year + 1)}
     for raw_year, seasons in sorted(results_dict.items()):
         for season in seasons or []:
-            onset       = pd.to_datetime(season['onset'])
+            onset       = pd.Timestamp(season['onset'])
             onset_year  = onset.year
             onset_month = onset.month
             if onset_year < start_year or onset_year > end_year: continue
             if onset_month in allowed_months:
-                cleaned[onset_year].append(season)
+                kept[onset_year].append((onset, season))
             else:
                 print(f"  Dropped {onset_year} off-season: "
                       f"{onset.strftime('%Y-%m-%d')} (month {onset_month})")
-    for year in cleaned:
-        cleaned[year] = sorted(cleaned[year], key=lambda s: pd.to_datetime(s['onset']))
-    return cleaned
+    return {
+        year: [season for _, season in sorted(pairs, key=lambda p: p[0])]
+        for year, pairs in kept.items()
+    }
 
 def remove_duplicate_seasons(refined_results):
     deduped = {}
     for year, seasons in refined_results.items():
         unique = []
+        kept   = []  # (onset, length) of each unique season, parsed once
         for season in seasons:
-            onset  = pd.to_datetime(season['onset'])
+            onset  = pd.Timestamp(season['onset'])
             length = season.get('length_days', 0)
             dup    = False
-            for kept in unique:
-                if (abs((onset - pd.to_datetime(kept['onset'])).days) <= 5 and
-                        abs(length - kept.get('length_days', 0)) <= 3):
+            for kept_onset, kept_length in kept:
+                if (abs((onset - kept_onset).days) <= 5 and
+                        abs(length - kept_length) <= 3):
                     print(f"  Duplicate dropped: {onset.strftime('%Y-%m-%d')}")
                     dup = True; break
             if not dup:
                 unique.append(season)
+                kept.append((onset, length))
         deduped[year] = unique
     return deduped
 
@@ -516,8 +629,8 @@ def compute_annual_stats(df: pd.DataFrame, year: int) -> Tuple[float, Dict[str,
 # 1.5-year window fetcher
 def fetch_full_year_plus_cessation(lat, lon, year, source="auto", extra_months=6):
     force      = None if source == "auto" else source
-    start_date = f"{year}-01-01"
-    end_date   = f"{year + 1}-06-30"
+    start_date = date(year, 1, 1)
+    end_date   = date(year + 1, 6, 30)
     print(f"  Fetching {start_date} to {end_date} ...")
     df = get_climate_data(lat, lon, start_date, end_date, force_source=force)
     df = add_et0(df, lat)
@@ -535,13 +648,44 @@ def fetch_and_analyze_years(
     """
     seasons_dict : Dict[int, List[Dict]] = {}
     annual_dict  : Dict[int, Dict]       = {}
+    years = range(start_year, end_year + 1)
+    force = None if source == "auto" else source
 
-    for ref_year in range(start_year, end_year + 1):
+    # Fetch the whole span (each window runs to June of the following year)
+    # in ONE call and slice the 1.5-year windows in memory.
+    span_start = date(start_year, 1, 1)
+    span_end   = date(end_year + 1, 6, 30)
+    print(f"  Fetching {span_start} to {span_end} (full span, one call) ...")
+    try:
+        master = get_climate_data(lat, lon, span_start, span_end, force_source=force)
+        master = add_et0(master, lat).sort_values('date').reset_index(drop=True)
+    except Exception as exc:
+        print(f"  (span fetch failed, falling back to per-year: {exc})")
+        master = None
+
+    frames:  Dict[int, pd.DataFrame] = {}
+    pending: Dict[int, Any]          = {}
+    if master is not None and not master.empty:
+        for y in years:
+            in_window = ((master['date'] >= pd.Timestamp(y, 1, 1)) &
+                         (master['date'] <= pd.Timestamp(y + 1, 6, 30)))
+            frames[y] = master[in_window].reset_index(drop=True)
+    else:
+        # Per-year fallback: the window fetches are independent and
+        # network-bound, so they run concurrently; detection below still
+        # walks the years in order.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(years)))) as ex:
+            pending = {
+                y: ex.submit(fetch_full_year_plus_cessation, lat, lon, y,
+                             source=source, extra_months=extra_months)
+                for y in years
+            }
+
+    for ref_year in years:
         print(f"\nAnalyzing ref year {ref_year}")
         try:
-            df_window = fetch_full_year_plus_cessation(
-                lat, lon, ref_year, source=source, extra_months=extra_months
-            )
+            df_window = frames[ref_year] if frames else pending[ref_year].result()
             if df_window is None or df_window.empty:
                 print(f"  Retrieved 0 days for {ref_year}")
                 seasons_dict[ref_year] = []
@@ -637,8 +781,8 @@ def fetch_and_analyze_years_fixed(
     # slice per year in memory. The per-year helpers filter internally by year
     # / window, so passing the full master frame yields identical results
     # while replacing N_years fetches with one.
-    overall_start = f"{start_year}-01-01"
-    overall_end   = max_cess.strftime("%Y-%m-%d")
+    overall_start = date(start_year, 1, 1)
+    overall_end   = max_cess
     print(f"  Fetching {overall_start} to {overall_end} (full span, one call) ...")
     try:
         master = get_climate_data(lat, lon, overall_start, overall_end, force_source=force)
@@ -868,6 +1012,7 @@ def main() -> None:
         ),
     )
     args = parser.parse_args()
+    set_logging()
 
     try:
         lat, lon = map(float, args.location.split(','))